@@ -0,0 +1,283 @@
+"""Micro-benchmarks for the hot paths in c.py
+
+Run with `python bench.py [resume files or folders...]`. Resumes given on the
+command line form the corpus for the analysis regression check, otherwise a
+synthetic corpus is used. The app is imported from a scratch directory so the
+benchmarks never touch the real database, uploads or feature store.
+"""
+import os
+import random
+import re
+import struct
+import sys
+import tempfile
+import timeit
+import zipfile
+
+CORPUS_PATHS = [os.path.abspath(path) for path in sys.argv[1:]]
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(tempfile.mkdtemp(prefix='bench-'))
+
+import c
+import numpy as np
+from flask import render_template, render_template_string
+
+def report(name, seconds, number):
+    print(f'{name:<48} {seconds / number * 1000:9.3f} ms')
+
+def sample_jobs(count=20):
+    return [{
+        'id': i,
+        'company_name': f'Company {i}',
+        'role_name': f'Software Engineer {i}',
+        'description': 'Build and run Python services on AWS',
+        'qualifications': 'Python, SQL, Docker',
+        'experience': '3 years',
+        'location': 'Remote',
+        'match_percentage': 90 - i,
+        'applied': i % 3 == 0
+    } for i in range(count)]
+
+def bench_templates(number=200):
+    """Per-request render cost of the job seeker dashboard"""
+    context = dict(username='bench', jobs=sample_jobs(), next_cursor=None, has_resume=True,
+                   skills=['python', 'sql'], education=['Bachelor'], experience='3 years')
+    with c.app.test_request_context('/dashboard'):
+        # Compiles the template source on every call
+        seconds = timeit.timeit(
+            lambda: render_template_string(c.job_seeker_dashboard, **context), number=number)
+        report('render_template_string (compile per request)', seconds, number)
+
+        # Compiled once by the registered loader, then served from the template cache
+        render_template('job_seeker_dashboard.html', **context)
+        seconds = timeit.timeit(
+            lambda: render_template('job_seeker_dashboard.html', **context), number=number)
+        report('render_template (cached compiled template)', seconds, number)
+
+RESUME_LINES = [f'Line {i}: built Python, SQL and Docker services on AWS for team {i}' for i in range(300)]
+
+def make_pdf(lines, lines_per_page=50):
+    """Minimal PDF with Helvetica text, one page per lines_per_page lines"""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None,
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for page in pages:
+        content = b'BT /F1 10 Tf 20 800 Td 12 TL ' + b' '.join(
+            b'(' + line.encode() + b") '" for line in page) + b' ET'
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents %d 0 R '
+                       b'/Resources << /Font << /F1 3 0 R >> >> >>' % len(objects))
+        kids.append(len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % kid for kid in kids), len(kids))
+    out = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return out
+
+def make_doc(body, sector_size=512):
+    """Minimal compound file like a Word 97-2003 document, body stored in its WordDocument stream"""
+    names = ['Root Entry', 'WordDocument', '1Table', '\x05SummaryInformation']
+    directory = b''
+    for number, name in enumerate(names):
+        encoded = (name + '\0').encode('utf-16-le')
+        entry = encoded.ljust(64, b'\0') + struct.pack('<HBB', len(encoded), 5 if number == 0 else 2, 1)
+        directory += entry.ljust(128, b'\0')
+    body_sectors = -(-len(body) // sector_size)
+    # Sector 0 is the allocation table, 1 the directory, the body follows
+    fat = [0xFFFFFFFD, 0xFFFFFFFE] + list(range(3, body_sectors + 2)) + [0xFFFFFFFE]
+    fat += [0xFFFFFFFF] * (sector_size // 4 - len(fat))
+    header = (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + bytes(16) + struct.pack('<HHHHH', 0x3E, 3, 0xFFFE, 9, 6)
+              + bytes(10) + struct.pack('<IIIIIIII', 1, 1, 0, 4096, 0xFFFFFFFE, 0, 0xFFFFFFFE, 0)
+              + struct.pack('<109I', 0, *[0xFFFFFFFF] * 108))
+    return (header + struct.pack(f'<{len(fat)}I', *fat) + directory.ljust(sector_size, b'\0')
+            + body.ljust(body_sectors * sector_size, b'\0'))
+
+def write_sample_resumes(lines):
+    """The same resume text in every supported format, returns {format: path}"""
+    paths = {name: f'sample.{name}' for name in c.TEXT_EXTRACTORS}
+    with open(paths['pdf'], 'wb') as f:
+        f.write(make_pdf(lines))
+    body = ''.join(f'<w:p><w:r><w:t>{line}</w:t></w:r></w:p>' for line in lines)
+    with zipfile.ZipFile(paths['docx'], 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml',
+                         '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                         f'<w:body>{body}</w:body></w:document>')
+    with open(paths['doc'], 'wb') as f:
+        # Plain ASCII text is stored 8-bit
+        f.write(make_doc('\r'.join(lines).encode('latin-1')))
+    with open(paths['txt'], 'w') as f:
+        f.write('\n'.join(lines))
+    with open(paths['rtf'], 'w') as f:
+        f.write('{\\rtf1\\ansi{\\fonttbl{\\f0 Arial;}}\\f0 ' + '\\par '.join(lines) + '}')
+    return paths
+
+def bench_extractors(number=20):
+    """Text extraction cost per format for a six page resume"""
+    for name, path in write_sample_resumes(RESUME_LINES).items():
+        extractor = c.TEXT_EXTRACTORS[name]
+        extractor(path)
+        seconds = timeit.timeit(lambda: extractor(path), number=number)
+        report(f'extract {name}', seconds, number)
+
+def bench_analysis(number=20):
+    """Resume analysis cost as the text grows, should stay linear in its length"""
+    for pages in (1, 4, 16):
+        text = '\n'.join(RESUME_LINES[:50] * pages) + '\nB.Tech, 5 years of experience'
+        c.analyze_resume_text(text)
+        seconds = timeit.timeit(lambda: c.analyze_resume_text(text), number=number)
+        report(f'analyze_resume_text, {pages} page(s)', seconds, number)
+
+def bench_experience(number=20, count=2000):
+    """Experience component for one resume against many jobs, parsing their text vs stored years"""
+    texts = [f'{RESUME_LINES[i % 300]}, {i % 10}-{i % 10 + 2} years of experience' for i in range(count)]
+    years = [c.experience_years(text) for text in texts]
+    seconds = timeit.timeit(
+        lambda: c.experience_match([5.0], [c.experience_years(text) for text in texts]), number=number)
+    report(f'experience_match, parsing {count} jobs', seconds, number)
+    seconds = timeit.timeit(lambda: c.experience_match([5.0], years), number=number)
+    report(f'experience_match, {count} stored years', seconds, number)
+
+# Terms of each job domain in the synthetic scorer corpus, mostly taxonomy skills
+SCORER_DOMAINS = {
+    'Data Scientist': ['python', 'pandas', 'numpy', 'statistics', 'machine learning', 'scikit-learn',
+                       'tableau', 'forecasting', 'experiments', 'models'],
+    'Frontend Developer': ['javascript', 'react', 'css', 'html', 'vue.js', 'figma', 'user interface',
+                           'components', 'accessibility', 'browsers'],
+    'Backend Engineer': ['java', 'spring boot', 'postgresql', 'redis', 'rest api', 'microservices',
+                         'latency', 'queues', 'golang', 'graphql'],
+    'DevOps Engineer': ['aws', 'docker', 'kubernetes', 'terraform', 'jenkins', 'ci/cd', 'monitoring',
+                        'infrastructure', 'incidents', 'gcp'],
+    'Mobile Developer': ['swift', 'kotlin', 'android', 'ios', 'flutter', 'react native', 'app store',
+                         'releases', 'xamarin', 'firebase'],
+    'ML Engineer': ['pytorch', 'tensorflow', 'deep learning', 'computer vision', 'nlp', 'gpus',
+                    'training pipelines', 'neural networks', 'inference', 'datasets'],
+    'Product Designer': ['figma', 'sketch', 'illustrator', 'photoshop', 'user experience', 'prototypes',
+                         'usability', 'adobe xd', 'research', 'branding'],
+    'Project Manager': ['project management', 'jira', 'confluence', 'leadership', 'communication',
+                        'negotiation', 'roadmaps', 'stakeholders', 'asana', 'budgets'],
+}
+
+def scorer_corpus(jobs_per_domain=50, resumes_per_domain=20, seed=0):
+    """Synthetic jobs and resumes with the index of their domain, resumes mention another domain too"""
+    rng = random.Random(seed)
+    titles = list(SCORER_DOMAINS)
+
+    def document(title, terms):
+        return (f'{title}. Work with {", ".join(terms)}. {rng.choice(RESUME_LINES)}. '
+                f'{rng.randint(1, 8)} years of experience')
+
+    jobs, job_domains, resumes, resume_domains = [], [], [], []
+    for domain, title in enumerate(titles):
+        terms = SCORER_DOMAINS[title]
+        for _ in range(jobs_per_domain):
+            jobs.append(document(title, rng.sample(terms, 5)))
+            job_domains.append(domain)
+        for _ in range(resumes_per_domain):
+            noise = rng.sample(SCORER_DOMAINS[rng.choice(titles)], 2)
+            resumes.append(document('Engineer', rng.sample(terms, 4) + noise))
+            resume_domains.append(domain)
+    return jobs, np.array(job_domains), resumes, np.array(resume_domains)
+
+def bench_scorers(number=5, k=5):
+    """Cost and ranking quality of each registered scorer, used on its own without the app
+
+    Quality is the share of each resume's top k jobs that are in the resume's domain.
+    """
+    jobs, job_domains, resumes, resume_domains = scorer_corpus()
+    documents = jobs + resumes
+    for name in c.SCORERS:
+        scorer = c.get_scorer(name)
+        model = scorer.fit(documents)
+        job_features = scorer.transform_jobs(jobs, model)
+        resume_features = scorer.transform_resumes(resumes, model)
+        scores = scorer.score_batch(resume_features, job_features)
+
+        seconds = timeit.timeit(lambda: scorer.fit(documents), number=number)
+        report(f'{name} fit, {len(documents)} documents', seconds, number)
+        seconds = timeit.timeit(lambda: scorer.transform_jobs(jobs, model), number=number)
+        report(f'{name} transform_jobs, {len(jobs)} jobs', seconds, number)
+        seconds = timeit.timeit(lambda: scorer.transform_resumes(resumes, model), number=number)
+        report(f'{name} transform_resumes, {len(resumes)} resumes', seconds, number)
+        seconds = timeit.timeit(lambda: scorer.score_batch(resume_features, job_features), number=number)
+        report(f'{name} score_batch, {len(resumes)} x {len(jobs)}', seconds, number)
+
+        top = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+        precision = (job_domains[top] == resume_domains[:, None]).mean()
+        print(f'{name} precision@{k} {precision:.3f}')
+
+# The per-call regex extractors analyze_resume_text replaced, kept as the reference
+LEGACY_EDUCATION_PATTERNS = [
+    r'(?i)(?:B\.?Tech|Bachelor of Technology)',
+    r'(?i)(?:M\.?Tech|Master of Technology)',
+    r'(?i)(?:B\.?E|Bachelor of Engineering)',
+    r'(?i)(?:M\.?S|Master of Science)',
+    r'(?i)(?:B\.?Sc|Bachelor of Science)',
+    r'(?i)(?:Ph\.?D|Doctor of Philosophy)',
+    r'(?i)(?:MBA|Master of Business Administration)'
+]
+LEGACY_EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s+years?\s+(?:of\s+)?experience',
+    r'experience\s+(?:of\s+)?(\d+)\+?\s+years?'
+]
+
+def legacy_analysis(text):
+    skills = c.extract_skills(text)
+    education = []
+    for pattern in LEGACY_EDUCATION_PATTERNS:
+        education.extend(re.findall(pattern, text))
+    experience = "Not specified"
+    for pattern in LEGACY_EXPERIENCE_PATTERNS:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            experience = match.group(1) + " years"
+            break
+    return skills, list(set(education)), experience
+
+def resume_corpus(paths):
+    """Texts of the resume files under paths, or synthetic resumes when none are given"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
+        else:
+            files.append(path)
+    if files:
+        return [text for text in map(c.extract_text_from_file, sorted(files)) if text]
+    degrees = ['B.Tech in Computer Science', 'Master of Science, Physics', 'MBA', 'PhD in Statistics']
+    return [f'{degrees[i % 4]}\n' + '\n'.join(RESUME_LINES[:10 + 15 * i])
+            + f'\n{i + 1} years of experience' for i in range(20)]
+
+def bench_corpus(paths, number=5):
+    """Analysis of a resume corpus against the legacy regex extractors
+
+    Returns False when the current analyzer is slower, so the run can fail.
+    """
+    texts = resume_corpus(paths)
+    if not texts:
+        print('No resume text found in the corpus')
+        return True
+    legacy = timeit.timeit(lambda: [legacy_analysis(text) for text in texts], number=number)
+    current = timeit.timeit(lambda: [c.analyze_resume_text(text) for text in texts], number=number)
+    report(f'legacy regex analysis, {len(texts)} resumes', legacy, number)
+    report(f'analyze_resume_text, {len(texts)} resumes', current, number)
+    changed = sum(legacy_analysis(text)[2] != c.analyze_resume_text(text)['experience'] for text in texts)
+    print(f'speedup {legacy / current:.2f}x, experience differs on {changed} of {len(texts)} resumes')
+    return current <= legacy
+
+if __name__ == '__main__':
+    bench_templates()
+    bench_extractors()
+    bench_analysis()
+    bench_experience()
+    bench_scorers()
+    if not bench_corpus(CORPUS_PATHS):
+        print('Resume analysis is slower than the legacy regex extractors')
+        sys.exit(1)
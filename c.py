@@ -1,32 +1,285 @@
 from flask import (
     Flask, 
     render_template, 
-    render_template_string,  # Added this import
     request, 
     redirect, 
     url_for, 
     session, 
     flash, 
     jsonify, 
-    send_from_directory
+    send_from_directory,
+    g,
+    has_app_context,
+    abort
 )
 import sqlite3
-from werkzeug.utils import secure_filename
+from jinja2 import ChoiceLoader, DictLoader
 import os
 import PyPDF2
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import json
+import base64
+import hashlib
+import pickle
+import shutil
+import struct
+import tempfile
+import zipfile
+from xml.etree import ElementTree
+import gzip
+import mimetypes
+from contextlib import contextmanager
+from collections import deque
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+from scipy.sparse import csr_matrix
 import numpy as np
+import threading
+import multiprocessing
+import atexit
+import queue
+import time
 from datetime import datetime
 
+# resource is Unix only, PDF extraction runs without a memory limit elsewhere
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# fcntl is Unix only, elsewhere the job feature store is locked within a process only
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Brotli is optional, responses fall back to gzip without it
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = Flask(__name__)
 app.secret_key = 'your_secret_key'
 
+DATABASE = 'database.db'
+DB_POOL_SIZE = 8  # idle connections kept for reuse
+
+# Applied once when a connection is opened
+DB_PRAGMAS = (
+    'PRAGMA busy_timeout = 5000',     # Queue behind other writers instead of failing
+    'PRAGMA synchronous = NORMAL',    # Durable enough with WAL, one fsync per checkpoint
+    'PRAGMA cache_size = -16000',     # 16 MB page cache per connection
+    'PRAGMA mmap_size = 268435456',   # Read pages through a 256 MB memory map
+    'PRAGMA temp_store = MEMORY',
+)
+
+def connect_db():
+    """Open a database connection with the app's pragmas applied"""
+    # Pooled connections move between request threads, one thread at a time
+    conn = sqlite3.connect(DATABASE, check_same_thread=False)
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+class ConnectionPool:
+    """Reuses SQLite connections across requests instead of reconnecting each time"""
+
+    def __init__(self, size):
+        self.size = size
+        self.pid = os.getpid()
+        self.idle = queue.LifoQueue()
+
+    def acquire(self):
+        if self.pid != os.getpid():
+            # Connections must not be shared with a forked parent
+            self.pid = os.getpid()
+            self.idle = queue.LifoQueue()
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            return connect_db()
+
+    def release(self, conn):
+        # Discard anything the request left uncommitted
+        conn.rollback()
+        if self.pid == os.getpid() and self.idle.qsize() < self.size:
+            self.idle.put(conn)
+        else:
+            conn.close()
+
+db_pool = ConnectionPool(DB_POOL_SIZE)
+thread_db = threading.local()
+
+def get_db():
+    """Connection shared by everything handling the current request
+
+    Outside a request (background threads and processes) each thread keeps
+    its own connection open instead.
+    """
+    if has_app_context():
+        if 'db' not in g:
+            g.db = db_pool.acquire()
+        return g.db
+    if getattr(thread_db, 'pid', None) != os.getpid():
+        thread_db.conn = connect_db()
+        thread_db.pid = os.getpid()
+    return thread_db.conn
+
+@app.teardown_appcontext
+def release_db(exception):
+    conn = g.pop('db', None)
+    if conn is not None:
+        db_pool.release(conn)
+
+# Serializes this process's writers so bursts wait their turn
+write_lock = threading.RLock()
+
+@contextmanager
+def db_write():
+    """Run a write transaction on the request's connection, one writer at a time
+
+    BEGIN IMMEDIATE takes SQLite's write lock up front, so a transaction never
+    fails halfway when upgrading from a read. Writers in other processes are
+    waited for through busy_timeout. Nested blocks join the outer transaction.
+    """
+    conn = get_db()
+    with write_lock:
+        if conn.in_transaction:
+            yield conn.cursor()
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn.cursor()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+def add_column_if_missing(cursor, table, column, declaration):
+    cursor.execute(f'PRAGMA table_info({table})')
+    if column not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {declaration}')
+
+def migrate_skill_bits(cursor):
+    """Add skill bitmask columns to databases created before they existed"""
+    for table in ('jobs', 'resumes'):
+        add_column_if_missing(cursor, table, 'skill_bits', 'BLOB')
+        add_column_if_missing(cursor, table, 'skills_version', 'TEXT')
+
+def migrate_resume_updated_at(cursor):
+    """Track resume changes so in-memory indexes can pick up other processes' writes"""
+    add_column_if_missing(cursor, 'resumes', 'updated_at', 'REAL')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resumes_updated_at ON resumes(updated_at)')
+
+def migrate_query_indexes(cursor):
+    """Index the columns the dashboards and apply flow filter and sort on"""
+    # Keep the first application of any duplicate pair before enforcing uniqueness
+    cursor.execute('''
+        DELETE FROM applications WHERE id NOT IN (
+            SELECT MIN(id) FROM applications GROUP BY job_id, user_id
+        )
+    ''')
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_job_user ON applications(job_id, user_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_user ON applications(user_id, job_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_date ON applications(application_date)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resumes_user ON resumes(user_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_posted_by ON jobs(posted_by)')
+
+def migrate_match_rank_index(cursor):
+    """Index cached scores in ranking order for paging through a user's matches"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_match_scores_rank
+        ON match_scores(user_id, model_version, score DESC, job_id)
+    ''')
+
+def migrate_match_job_rank_index(cursor):
+    """Index cached scores in ranking order for reading a job's top candidates"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_match_scores_job_rank
+        ON match_scores(job_id, model_version, score DESC, user_id)
+    ''')
+
+def migrate_resume_jobs(cursor):
+    """Add the queue of uploaded resumes waiting for background processing"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        filepath TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued',
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_jobs_status ON resume_jobs(status, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_jobs_user ON resume_jobs(user_id, id)')
+
+def migrate_resume_extractions(cursor):
+    """Add the cache of resume analyses keyed by the uploaded file's content hash"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_extractions (
+        content_hash TEXT PRIMARY KEY,
+        resume_text TEXT NOT NULL,
+        skills TEXT,
+        education TEXT,
+        experience TEXT,
+        skill_bits BLOB,
+        skills_version TEXT,
+        extractor_version INTEGER NOT NULL,
+        created_at REAL NOT NULL
+    )
+    ''')
+    add_column_if_missing(cursor, 'resume_jobs', 'content_hash', 'TEXT')
+
+def migrate_experience_years(cursor):
+    """Store experience as numeric years next to its display text
+
+    Rows written before this migration keep NULL and are parsed from their text
+    when read.
+    """
+    for table in ('resumes', 'jobs', 'resume_extractions'):
+        add_column_if_missing(cursor, table, 'experience_years', 'REAL')
+
+# Schema migrations in the order they were introduced, never reorder or remove entries.
+# The database's PRAGMA user_version records how many have been applied.
+MIGRATIONS = [
+    migrate_skill_bits,
+    migrate_resume_updated_at,
+    migrate_query_indexes,
+    migrate_match_rank_index,
+    migrate_resume_jobs,
+    migrate_resume_extractions,
+    migrate_experience_years,
+    migrate_match_job_rank_index,
+]
+
+def run_migrations(conn):
+    """Apply pending schema migrations, each in its own transaction"""
+    for version, migration in enumerate(MIGRATIONS, start=1):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Re-read under the write lock so concurrent workers starting up apply each step once
+            current = conn.execute('PRAGMA user_version').fetchone()[0]
+            if current >= version:
+                conn.rollback()
+                continue
+            migration(conn.cursor())
+            conn.execute(f'PRAGMA user_version = {version}')
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
 # Database setup
 # Replace your existing init_db() function with this one
 def init_db():
-    conn = sqlite3.connect('database.db')
+    conn = connect_db()
+    # WAL lets readers carry on while a write is in progress, the mode persists in the file
+    conn.execute('PRAGMA journal_mode = WAL')
     cursor = conn.cursor()
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS users (
@@ -46,6 +299,8 @@ def init_db():
         experience TEXT NOT NULL,
         location TEXT,
         posted_by INTEGER,
+        skill_bits BLOB,
+        skills_version TEXT,
         FOREIGN KEY (posted_by) REFERENCES users(id)
     )
     ''')
@@ -57,6 +312,8 @@ def init_db():
         skills TEXT,
         education TEXT,
         experience TEXT,
+        skill_bits BLOB,
+        skills_version TEXT,
         FOREIGN KEY (user_id) REFERENCES users(id)
     )
     ''')
@@ -72,7 +329,22 @@ def init_db():
         FOREIGN KEY (user_id) REFERENCES users(id)
     )
     ''')
+    # Cached match scores, recomputed when a resume or job changes
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS match_scores (
+        user_id INTEGER NOT NULL,
+        job_id INTEGER NOT NULL,
+        score REAL NOT NULL,
+        components TEXT,
+        model_version INTEGER NOT NULL,
+        PRIMARY KEY (user_id, job_id),
+        FOREIGN KEY (user_id) REFERENCES users(id),
+        FOREIGN KEY (job_id) REFERENCES jobs(id)
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_scores_job ON match_scores(job_id)')
     conn.commit()
+    run_migrations(conn)
     conn.close()
 
 # Initialize the database
@@ -80,579 +352,1791 @@ init_db()
 
 # Add these configurations after app initialization
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
+ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'rtf', 'txt'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # bytes per resume file
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Werkzeug rejects larger requests with 413 before reading them, with room for the form framing
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_SIZE + 64 * 1024
 
 # Create uploads directory if it doesn't exist
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
-def analyze_resume(filepath):
-    """Analyze resume and extract information"""
-    text = extract_text_from_file(filepath)
 
-    # Extract basic information
-    skills = extract_skills(text)
-    education = extract_education(text)
-    experience = extract_experience(text)
+# Job features and the fitted match model are kept on disk between restarts
+FEATURE_FOLDER = 'features'
+if not os.path.exists(FEATURE_FOLDER):
+    os.makedirs(FEATURE_FOLDER)
 
-    # Store the full text for matching
-    resume_text = text
+# Bump when the extractors below change so cached analyses are recomputed from their text
+RESUME_EXTRACTOR_VERSION = 7
+# The last extractor version that changed the text pulled from files, cached text
+# from before it is extracted again rather than reused
+RESUME_TEXT_VERSION = 6
 
+def analyze_resume(filepath):
+    """Analyze resume and extract information"""
+    return analyze_resume_text(extract_text_from_file(filepath))
+
+def analyze_resume_text(text):
+    """Extract skills, education and experience from resume text in one pass over its tokens"""
+    taxonomy = skill_index.current()
+    tokens = tokenize(text)
+
+    # Walk the combined skill and degree automaton, the same steps as SkillMatcher.find
+    matcher = taxonomy.resume_matcher
+    goto, fail, output = matcher.goto, matcher.fail, matcher.output
+    found = set()
+    state = 0
+    experience = None
+    for i, token in enumerate(tokens):
+        while state and token not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(token, 0)
+        if output[state]:
+            found.update(output[state])
+        # Experience phrases all pivot on a 'year(s)' token
+        if token in YEAR_WORDS and (experience is None or experience[0]):
+            stated = stated_experience(tokens, i)
+            if stated and (experience is None or stated[0] < experience[0]):
+                experience = stated
+
+    skill_ids = {item for item in found if isinstance(item, int)}
     return {
-        'skills': skills,
-        'education': education,
-        'experience': experience,
-        'full_text': resume_text
+        'skills': skill_names(skill_ids),
+        'skill_bits': skill_bitsets([skill_ids])[0],
+        'education': [degree for degree in EDUCATION_DEGREES if degree in found],
+        'experience': format_experience(experience),
+        'experience_years': experience[1] if experience else 0.0,
+        'full_text': text
     }
 
+# PDF text is extracted in a separate pool of processes so a pathological file can be
+# cut off by a deadline and cannot take the calling process's memory with it
+PDF_EXTRACT_PROCESSES = 4
+PDF_EXTRACT_TIMEOUT = 30  # seconds allowed per document
+PDF_MAX_PAGES = 50  # pages beyond this are ignored
+PDF_PAGES_PER_TASK = 8  # documents up to this many pages are extracted by a single process
+PDF_EXTRACT_MEMORY = 1024 * 1024 * 1024  # address space limit of each extraction process, in bytes
+
+def limit_extraction_memory():
+    if resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (PDF_EXTRACT_MEMORY, PDF_EXTRACT_MEMORY))
+
+def extract_pdf_pages(filepath, start, stop):
+    """Page count of a PDF and the text of its pages in [start, stop)"""
+    pdf_reader = PyPDF2.PdfReader(filepath)
+    pages = pdf_reader.pages
+    return len(pages), [pages[i].extract_text() or '' for i in range(start, min(stop, len(pages)))]
+
+class ExtractionPool:
+    """Process pool for PDF extraction, created on first use in each process"""
+
+    def __init__(self, processes):
+        self.processes = processes
+        self.pool = None
+        self.pid = None
+
+    def get(self):
+        if self.pool is None or self.pid != os.getpid():
+            self.pool = multiprocessing.Pool(self.processes, initializer=limit_extraction_memory,
+                                             maxtasksperchild=100)
+            self.pid = os.getpid()
+        return self.pool
+
+    def reset(self):
+        """Kill the pool, including any extraction still running in it"""
+        if self.pool is not None and self.pid == os.getpid():
+            self.pool.terminate()
+        self.pool = None
+
+extraction_pool = ExtractionPool(PDF_EXTRACT_PROCESSES)
+
+def extract_pdf_text(filepath):
+    """Extract the text of a PDF's first PDF_MAX_PAGES pages, in parallel for long documents"""
+    deadline = time.monotonic() + PDF_EXTRACT_TIMEOUT
+    pool = extraction_pool.get()
+    try:
+        # The first task also reports the page count, which decides whether to fan out
+        page_count, texts = pool.apply_async(
+            extract_pdf_pages, (filepath, 0, PDF_PAGES_PER_TASK)).get(PDF_EXTRACT_TIMEOUT)
+        last_page = min(page_count, PDF_MAX_PAGES)
+        tasks = [pool.apply_async(extract_pdf_pages, (filepath, start, start + PDF_PAGES_PER_TASK))
+                 for start in range(PDF_PAGES_PER_TASK, last_page, PDF_PAGES_PER_TASK)]
+        for task in tasks:
+            texts.extend(task.get(max(deadline - time.monotonic(), 0))[1])
+    except multiprocessing.TimeoutError:
+        extraction_pool.reset()
+        raise TimeoutError(f'PDF text extraction took longer than {PDF_EXTRACT_TIMEOUT} seconds')
+    return ''.join(texts[:PDF_MAX_PAGES])
+
+# Limits on the work any single resume file can cause
+RESUME_MAX_TEXT_LENGTH = 200000  # characters of text kept from any file
+DOCX_MAX_XML_SIZE = 20 * 1024 * 1024  # uncompressed bytes of word/document.xml
+DOC_MAX_SIZE = 5 * 1024 * 1024  # bytes of a legacy .doc file scanned for text
+RTF_MAX_SIZE = 5 * 1024 * 1024  # bytes of RTF source parsed
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+def extract_docx_text(filepath):
+    """Extract text from a DOCX file, streaming word/document.xml out of the archive"""
+    with zipfile.ZipFile(filepath) as archive:
+        info = archive.getinfo('word/document.xml')
+        # The declared size guards against zip bombs before anything is decompressed
+        if info.file_size > DOCX_MAX_XML_SIZE:
+            raise ValueError(f'word/document.xml is larger than {DOCX_MAX_XML_SIZE} bytes')
+        parts = []
+        length = 0
+        with archive.open(info) as document:
+            for _, element in ElementTree.iterparse(document):
+                tag = element.tag
+                if tag == WORD_NAMESPACE + 't':
+                    parts.append(element.text or '')
+                    length += len(parts[-1])
+                elif tag == WORD_NAMESPACE + 'tab':
+                    parts.append('\t')
+                elif tag in (WORD_NAMESPACE + 'br', WORD_NAMESPACE + 'cr'):
+                    parts.append('\n')
+                elif tag == WORD_NAMESPACE + 'p':
+                    parts.append('\n')
+                    # Finished paragraphs are dropped so memory stays flat on long documents
+                    element.clear()
+                if length >= RESUME_MAX_TEXT_LENGTH:
+                    break
+    return ''.join(parts)
+
+# Printable runs of UTF-16LE text (first group) or 8-bit text (second group)
+DOC_TEXT_RUN = re.compile(rb'((?:[\x20-\x7e\xa0-\xff\t\r\n]\x00){4,})|([\x20-\x7e\t\r\n]{4,})')
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+OLE_MAX_SECTOR = 0xFFFFFFFA  # sector numbers from here up mark chain ends and free sectors
+
+def ole_directory_spans(data):
+    """Byte ranges of a compound file's directory sectors, [] if data is not one
+
+    Follows the directory's chain through the sectors of the allocation table
+    listed in the header.
+    """
+    if not data.startswith(OLE_SIGNATURE) or len(data) < 512:
+        return []
+    sector_size = 1 << struct.unpack_from('<H', data, 0x1E)[0]
+    if sector_size not in (512, 4096):
+        return []
+
+    def offset(sector):
+        return (sector + 1) * sector_size
+
+    fat = []
+    for sector in struct.unpack_from('<109I', data, 0x4C):
+        if sector >= OLE_MAX_SECTOR or offset(sector) + sector_size > len(data):
+            break
+        fat.extend(struct.unpack_from(f'<{sector_size // 4}I', data, offset(sector)))
+
+    spans = []
+    sector = struct.unpack_from('<I', data, 0x30)[0]
+    # Bounded by the table's size so a corrupt, cyclic chain still ends
+    while sector < OLE_MAX_SECTOR and len(spans) <= len(fat):
+        spans.append((offset(sector), offset(sector) + sector_size))
+        if sector >= len(fat):
+            break
+        sector = fat[sector]
+    return spans
+
+def extract_doc_text(filepath):
+    """Best-effort text of a legacy binary Word file from its runs of printable characters
+
+    Word 97-2003 stores document text as 8-bit runs when it is plain ASCII and
+    as UTF-16LE otherwise, so both kinds of run are collected in file order.
+    The directory sectors are blanked first, their UTF-16 stream names
+    ('Root Entry', 'WordDocument', ...) are not document text.
+    """
+    with open(filepath, 'rb') as f:
+        data = bytearray(f.read(DOC_MAX_SIZE))
+    for start, end in ole_directory_spans(data):
+        data[start:end] = bytes(len(data[start:end]))
+    return '\n'.join(wide.decode('utf-16-le') if wide else narrow.decode('latin-1')
+                     for wide, narrow in DOC_TEXT_RUN.findall(data))
+
+def extract_plain_text(filepath):
+    with open(filepath, encoding='utf-8', errors='replace') as f:
+        return f.read(RESUME_MAX_TEXT_LENGTH)
+
+RTF_TOKEN = re.compile(r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-fA-F]{2})|\\(.)|([{}])|[\r\n]+|([^\\{}\r\n]+)", re.S)
+# Groups whose content is formatting or metadata rather than document text
+RTF_SKIP_DESTINATIONS = {'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'header',
+                         'footer', 'headerl', 'headerr', 'footerl', 'footerr', 'listtable',
+                         'listoverridetable', 'rsidtbl', 'generator', 'themedata', 'datastore',
+                         'latentstyles', 'xmlnstbl', 'filetbl', 'revtbl'}
+RTF_SPECIAL_CHARACTERS = {'par': '\n', 'line': '\n', 'sect': '\n', 'page': '\n', 'row': '\n',
+                          'cell': '\t', 'tab': '\t', 'emdash': '\u2014', 'endash': '\u2013',
+                          'bullet': '\u2022', 'lquote': '\u2018', 'rquote': '\u2019',
+                          'ldblquote': '\u201c', 'rdblquote': '\u201d'}
+
+def extract_rtf_text(filepath):
+    """Extract text from an RTF file in a single pass over its control words"""
+    with open(filepath, encoding='latin-1') as f:
+        source = f.read(RTF_MAX_SIZE)
+
+    parts = []
+    stack = []
+    skipping = False
+    unicode_skip = 1  # fallback characters that follow each \u escape
+    pending_skip = 0
+    for match in RTF_TOKEN.finditer(source):
+        word, argument, hex_code, symbol, brace, text = match.groups()
+        if brace == '{':
+            stack.append((skipping, unicode_skip))
+        elif brace == '}':
+            if stack:
+                skipping, unicode_skip = stack.pop()
+        elif word:
+            if word in RTF_SKIP_DESTINATIONS:
+                skipping = True
+            elif word == 'uc':
+                unicode_skip = int(argument or 1)
+            elif skipping:
+                continue
+            elif word == 'u':
+                code = int(argument)
+                parts.append(chr(code + 65536 if code < 0 else code))
+                pending_skip = unicode_skip
+            elif word in RTF_SPECIAL_CHARACTERS:
+                parts.append(RTF_SPECIAL_CHARACTERS[word])
+        elif symbol == '*':
+            # \* marks an optional destination a reader may ignore
+            skipping = True
+        elif skipping:
+            continue
+        elif hex_code:
+            if pending_skip:
+                pending_skip -= 1
+            else:
+                parts.append(bytes([int(hex_code, 16)]).decode('cp1252', errors='replace'))
+        elif symbol in ('\\', '{', '}'):
+            parts.append(symbol)
+        elif symbol == '~':
+            parts.append('\u00a0')
+        elif text:
+            if pending_skip:
+                skipped = min(pending_skip, len(text))
+                text = text[skipped:]
+                pending_skip -= skipped
+            parts.append(text)
+    return ''.join(parts)
+
+# Extraction handler for each accepted file format
+TEXT_EXTRACTORS = {
+    'pdf': extract_pdf_text,
+    'docx': extract_docx_text,
+    'doc': extract_doc_text,
+    'txt': extract_plain_text,
+    'rtf': extract_rtf_text,
+}
+
+def detect_format(filepath):
+    """File format from the file's leading bytes, falling back to its extension"""
+    with open(filepath, 'rb') as f:
+        signature = f.read(8)
+    if signature.startswith(b'%PDF'):
+        return 'pdf'
+    if signature.startswith(b'PK\x03\x04'):
+        return 'docx'
+    if signature.startswith(b'{\\rtf'):
+        return 'rtf'
+    if signature.startswith(OLE_SIGNATURE):
+        return 'doc'
+    return filepath.rsplit('.', 1)[-1].lower()
+
 def extract_text_from_file(filepath):
-    """Extract text from PDF file"""
+    """Extract text from a resume file in any supported format"""
     text = ""
     try:
-        if filepath.endswith('.pdf'):
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
+        extractor = TEXT_EXTRACTORS.get(detect_format(filepath))
+        if extractor:
+            text = extractor(filepath)[:RESUME_MAX_TEXT_LENGTH]
+    except TimeoutError:
+        raise
     except Exception as e:
         print(f"Error extracting text: {e}")
     return text
 
+# Skill taxonomy, reloaded without a restart when the file changes
+SKILL_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skill_taxonomy.json')
+TAXONOMY_CHECK_INTERVAL = 5  # seconds between checks of the file's mtime
+MAX_SKILL_ID = 4096  # skill IDs index bits of every stored bitmask, 64 uint64 words at most
+
+# A decimal is one token only when its digits touch the point, so a sentence's
+# closing period followed by a number ('2020. 2 years') stays two numbers
+TOKEN_PATTERN = re.compile(r'\d+\.\d+\b|\w+|[^\w\s]')
+
+def tokenize(text):
+    """Split text into lowercase word and punctuation tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+# Degrees reported for each set of spellings. Spellings match whole tokens, so the
+# letters of a degree inside another word ('ms' in 'systems') are not a degree.
+# 'be' alone is left out, as a whole word it is nearly always the verb, and 'ms' only
+# counts followed by 'in', 'degree' or '(' so 'MS Office' and '900 ms' are not a degree.
+EDUCATION_DEGREES = {
+    'B.Tech': ['b.tech', 'btech', 'bachelor of technology'],
+    'M.Tech': ['m.tech', 'mtech', 'master of technology'],
+    'B.E': ['b.e', 'bachelor of engineering'],
+    'M.S': ['m.s', 'ms in', 'ms degree', 'ms (', 'm.sc', 'msc', 'master of science'],
+    'B.Sc': ['b.sc', 'bsc', 'bachelor of science'],
+    'Ph.D': ['ph.d', 'phd', 'doctor of philosophy'],
+    'MBA': ['mba', 'm.b.a', 'master of business administration'],
+}
+
+YEAR_WORDS = {'year', 'years'}
+RANGE_WORDS = {'-', '–', 'to'}
+
+# Numbers above this are not years of experience, e.g. a graduation year
+MAX_EXPERIENCE_YEARS = 50
+
+def number_at(tokens, j):
+    """Value of the number token at j, None if it is not a number"""
+    if j < 0 or not tokens[j].replace('.', '', 1).isdecimal():
+        return None
+    return float(tokens[j])
+
+def years_ending_at(tokens, j):
+    """'<n>', '<n>+', '<a>-<b>' or '<a> to <b>' whose last token is at j
+
+    Returns (low, high, index of the first token), None if there is no number
+    at j or it is more than MAX_EXPERIENCE_YEARS.
+    """
+    if j >= 0 and tokens[j] == '+':
+        j -= 1
+    high = number_at(tokens, j)
+    if high is None or high > MAX_EXPERIENCE_YEARS:
+        return None
+    if j >= 2 and tokens[j - 1] in RANGE_WORDS:
+        low = number_at(tokens, j - 2)
+        if low is not None and low <= high:
+            return low, high, j - 2
+    return high, high, j
+
+def stated_experience(tokens, i):
+    """Experience phrase around the 'year(s)' token at i
+
+    Returns (0, low, high) for '<years> year(s) [of] experience', (1, low, high)
+    for 'experience [of] <years> year(s)' and None otherwise, where <years> is a
+    number or a range. The first form wins when a text has both.
+    """
+    span = years_ending_at(tokens, i - 1)
+    if span is None:
+        return None
+    low, high, start = span
+
+    k = i + 1
+    if k < len(tokens) and tokens[k] == 'of':
+        k += 1
+    if k < len(tokens) and tokens[k] == 'experience':
+        return 0, low, high
+
+    j = start - 1
+    if j >= 0 and tokens[j] == 'of':
+        j -= 1
+    if j >= 0 and tokens[j] == 'experience':
+        return 1, low, high
+    return None
+
+def format_experience(stated):
+    """Display text of a stated experience, e.g. '5 years' or '3-5 years'"""
+    if stated is None:
+        return "Not specified"
+    _, low, high = stated
+    if low == high:
+        return f"{low:g} years"
+    return f"{low:g}-{high:g} years"
+
+class SkillMatcher:
+    """Aho-Corasick automaton over word tokens
+
+    Patterns are token sequences, so matches always start and end on word
+    boundaries and every pattern in a text is found in a single pass.
+    """
+
+    def __init__(self, patterns):
+        # patterns maps pattern text to the IDs it reports
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for pattern, skill_ids in patterns.items():
+            state = 0
+            for token in tokenize(pattern):
+                if token not in self.goto[state]:
+                    self.goto[state][token] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = self.goto[state][token]
+            self.output[state] += tuple(skill_ids)
+
+        # Breadth-first so every failure target is finished before it is used
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.output[child] += self.output[self.fail[child]]
+                queue.append(child)
+
+    def find(self, tokens):
+        """Return every skill ID whose pattern occurs in the token sequence"""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+class SkillTaxonomy:
+    """One compiled version of the skill taxonomy file"""
+
+    def __init__(self, data, version):
+        """Raises ValueError for skill IDs that are not unique ints in [0, MAX_SKILL_ID)"""
+        self.version = version
+        self.names = {}
+        patterns = {}
+        for skill in data['skills']:
+            skill_id = skill['id']
+            if type(skill_id) is not int or not 0 <= skill_id < MAX_SKILL_ID:
+                raise ValueError(f"Skill ID {skill_id!r} is not an integer in [0, {MAX_SKILL_ID})")
+            if skill_id in self.names:
+                raise ValueError(f"Skill ID {skill_id} is used by both {self.names[skill_id]!r} "
+                                 f"and {skill['name']!r}")
+            self.names[skill_id] = skill['name']
+            for pattern in [skill['name']] + skill.get('synonyms', []):
+                patterns.setdefault(pattern, []).append(skill['id'])
+        self.matcher = SkillMatcher(patterns)
+        # Resumes are scanned for skills and degrees together in a single pass
+        for degree, spellings in EDUCATION_DEGREES.items():
+            for spelling in spellings:
+                patterns.setdefault(spelling, []).append(degree)
+        self.resume_matcher = SkillMatcher(patterns)
+        # Skill bitmasks are this many uint64 words wide
+        self.words = max(self.names, default=0) // 64 + 1
+
+class SkillIndex:
+    """Keeps the compiled taxonomy in step with its data file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.taxonomy = None
+        self.mtime = None
+        self.checked_at = 0
+        self.lock = threading.Lock()
+
+    def load(self):
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        version = hashlib.sha1(raw).hexdigest()[:12]
+        if self.taxonomy is None or self.taxonomy.version != version:
+            self.taxonomy = SkillTaxonomy(json.loads(raw), version)
+
+    def current(self):
+        """Return the compiled taxonomy, recompiling it if the file changed"""
+        if time.time() - self.checked_at < TAXONOMY_CHECK_INTERVAL:
+            return self.taxonomy
+        with self.lock:
+            if time.time() - self.checked_at >= TAXONOMY_CHECK_INTERVAL:
+                self.checked_at = time.time()
+                try:
+                    mtime = os.stat(self.path).st_mtime_ns
+                    if mtime != self.mtime:
+                        self.load()
+                        self.mtime = mtime
+                except (OSError, ValueError, KeyError) as e:
+                    if self.taxonomy is None:
+                        raise
+                    # Keep serving the last good taxonomy until the file is fixed
+                    print(f"Error reloading skill taxonomy: {e}")
+        return self.taxonomy
+
+skill_index = SkillIndex(SKILL_TAXONOMY_PATH)
+skill_index.current()
+
+def extract_skill_ids(text):
+    """Extract the taxonomy IDs of the skills found in text"""
+    return skill_index.current().matcher.find(tokenize(text))
+
+def skill_names(skill_ids):
+    names = skill_index.current().names
+    return [names[skill_id] for skill_id in skill_ids]
+
 def extract_skills(text):
-    # ... existing code ...
-    
-    # Comprehensive skill sets
-    technical_skills = {
-        # Programming Languages
-        'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'golang',
-        # Web Technologies
-        'html', 'css', 'react', 'angular', 'vue.js', 'node.js', 'django', 'flask', 'spring boot',
-        'express.js', 'bootstrap', 'jquery', 'rest api', 'graphql',
-        # Databases
-        'sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'elasticsearch', 'firebase',
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'ci/cd', 'terraform',
-        # AI/ML
-        'machine learning', 'deep learning', 'neural networks', 'nlp', 'computer vision',
-        'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-        # Data Science
-        'data analysis', 'data visualization', 'statistics', 'r', 'tableau', 'power bi',
-        # Mobile Development
-        'android', 'ios', 'react native', 'flutter', 'xamarin',
-    }
-    
-    soft_skills = {
-        'leadership', 'communication', 'teamwork', 'problem solving', 'time management',
-        'project management', 'critical thinking', 'decision making', 'organizational',
-        'analytical', 'creativity', 'interpersonal', 'adaptability', 'flexibility',
-        'presentation', 'collaboration', 'negotiation', 'conflict resolution'
-    }
-    
-    tools = {
-        'jira', 'confluence', 'slack', 'trello', 'asana', 'photoshop', 'illustrator',
-        'figma', 'sketch', 'adobe xd', 'visual studio', 'intellij', 'eclipse',
-        'postman', 'swagger', 'microsoft office', 'excel', 'powerpoint', 'word'
+    """Extract known skills from text in one pass of the skill matcher"""
+    return skill_names(extract_skill_ids(text))
+
+def skill_bitsets(skill_id_sets):
+    """Pack skill ID sets into fixed-width uint64 bitmasks, one row per set"""
+    bits = np.zeros((len(skill_id_sets), skill_index.current().words), dtype=np.uint64)
+    rows = np.array([row for row, skill_ids in enumerate(skill_id_sets) for _ in skill_ids], dtype=np.intp)
+    ids = np.array([skill_id for skill_ids in skill_id_sets for skill_id in skill_ids], dtype=np.uint64)
+    np.bitwise_or.at(bits, (rows, (ids >> np.uint64(6)).astype(np.intp)),
+                     np.left_shift(np.uint64(1), ids & np.uint64(63)))
+    return bits
+
+def stored_skill_bits(blob, version, text):
+    """Decode a row's stored skill bitmask, re-extracting it if the taxonomy changed since"""
+    if blob is not None and version == skill_index.current().version:
+        return np.frombuffer(blob, dtype=np.uint64)
+    return skill_bitsets([extract_skill_ids(text)])[0]
+
+def popcount(bits):
+    """Number of set bits, summed over the last axis"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+    # NumPy < 2.0
+    bytes_view = np.ascontiguousarray(bits).view(np.uint8)
+    return np.unpackbits(bytes_view, axis=-1).sum(axis=-1, dtype=np.int64)
+
+def parse_experience(text):
+    """Experience stated in text as (rank, low, high), see stated_experience, or None"""
+    tokens = tokenize(text)
+    experience = None
+    for i, token in enumerate(tokens):
+        if token in YEAR_WORDS:
+            stated = stated_experience(tokens, i)
+            if stated and (experience is None or stated[0] < experience[0]):
+                experience = stated
+                if not stated[0]:
+                    break
+    return experience
+
+def experience_years(text):
+    """Years of experience stated in text, the lower bound of a range, 0 when not specified"""
+    experience = parse_experience(text)
+    return experience[1] if experience else 0.0
+
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+def required_experience_years(experience, text):
+    """Years a job requires, 0 when it states none
+
+    Taken from the first number in the job's experience field, which is also
+    the lower bound of a range like '3-5 years', and otherwise from an
+    experience phrase anywhere in the job's text.
+    """
+    for match in NUMBER_PATTERN.finditer(experience or ''):
+        years = float(match.group())
+        if years <= MAX_EXPERIENCE_YEARS:
+            return years
+    return experience_years(text)
+
+def stored_experience_years(years, text):
+    """A resume's stored years of experience, parsed from its text if stored before the column existed"""
+    return years if years is not None else experience_years(text)
+
+def job_experience_years(job):
+    """Stored required years of a row from the jobs table, parsed if stored before the column existed"""
+    return job[10] if job[10] is not None else required_experience_years(job[5], job_text(job))
+
+# Matching model settings
+MODEL_REFIT_INTERVAL = 6 * 60 * 60   # Refit every 6 hours when any document was added
+MODEL_REFIT_MIN_NEW_DOCS = 50        # ...or as soon as this many documents were added
+MODEL_REFIT_GROWTH = 0.2             # ...or the corpus grew by 20%
+MODEL_CHECK_INTERVAL = 60            # seconds between an idle worker's staleness checks
+
+# Matching strategy of this deployment, one of SCORERS
+MATCH_SCORER = os.environ.get('MATCH_SCORER', 'tfidf')
+
+class MatchModel:
+    """Corpus-level text model of the match scorer, shared by every match calculation"""
+
+    def __init__(self, path, scorer):
+        self.path = path
+        self.scorer = scorer
+        self.vectorizer = None
+        self.fitted_at = 0
+        self.fitted_docs = 0
+        self.fitted_job_id = 0  # newest job in the corpus the model was fitted on
+        self.loaded_mtime = None
+        self.lock = threading.Lock()
+
+    @property
+    def version(self):
+        return model_version(self.vectorizer)
+
+    def new_documents(self):
+        """Jobs posted and resumes saved since the model's corpus was read
+
+        Counted in the database, so documents added by any process are seen.
+        """
+        cursor = get_db().cursor()
+        cursor.execute('''
+            SELECT (SELECT COUNT(*) FROM jobs WHERE id > ?) +
+                   (SELECT COUNT(*) FROM resumes WHERE updated_at > ?)
+        ''', (self.fitted_job_id, self.fitted_at))
+        return cursor.fetchone()[0]
+
+    def needs_refit(self):
+        if self.vectorizer is None:
+            return True
+        new_docs = self.new_documents()
+        if new_docs == 0:
+            # A refit over the same corpus would only invalidate every stored score
+            return False
+        return (time.time() - self.fitted_at > MODEL_REFIT_INTERVAL or
+                new_docs >= MODEL_REFIT_MIN_NEW_DOCS or
+                new_docs > self.fitted_docs * MODEL_REFIT_GROWTH)
+
+    def fit(self, documents):
+        """Fit a fresh vectorizer over the corpus and swap it in"""
+        try:
+            vectorizer = self.scorer.fit(documents)
+        except ValueError:
+            # Empty corpus or nothing but stop words, keep the previous model
+            return False
+        vectorizer.model_version = time.time_ns()
+        self.vectorizer = vectorizer
+        self.fitted_at = time.time()
+        self.fitted_docs = len(documents)
+        return True
+
+    def save(self):
+        """Write the fitted model next to the job feature store"""
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'scorer': self.scorer.name,
+                         'vectorizer': self.vectorizer,
+                         'fitted_at': self.fitted_at,
+                         'fitted_docs': self.fitted_docs,
+                         'fitted_job_id': self.fitted_job_id}, f)
+        os.replace(tmp_path, self.path)
+        self.loaded_mtime = os.stat(self.path).st_mtime_ns
+
+    def load(self):
+        """Adopt the model on disk when another process saved a newer one"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self.loaded_mtime:
+                return False
+            with open(self.path, 'rb') as f:
+                saved = pickle.load(f)
+        except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+            return False
+        self.loaded_mtime = mtime
+        if saved['scorer'] != self.scorer.name:
+            return False
+        if saved['vectorizer'].model_version <= self.version:
+            return False
+        self.vectorizer = saved['vectorizer']
+        self.fitted_at = saved['fitted_at']
+        self.fitted_docs = saved['fitted_docs']
+        self.fitted_job_id = saved['fitted_job_id']
+        return True
+
+    @contextmanager
+    def locked(self):
+        """Fit one model at a time across threads and, where fcntl exists, processes"""
+        with self.lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.path + '.lock', 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                yield
+
+    def refit(self):
+        """Fit over the whole corpus and save the model for every process"""
+        # Taken before reading the corpus, documents saved meanwhile count as new
+        loaded_at = time.time()
+        cursor = get_db().cursor()
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM jobs')
+        last_job_id = cursor.fetchone()[0]
+        if not self.fit(load_corpus()):
+            return False
+        self.fitted_at, self.fitted_job_id = loaded_at, last_job_id
+        self.save()
+        return True
+
+    def refresh(self):
+        """Refit when the model is stale, returning whether it was refitted
+
+        Run by resume workers and the refit-model command, outside of requests.
+        """
+        if not self.scorer.needs_corpus:
+            return False
+        self.load()
+        if not self.needs_refit():
+            return False
+        with self.locked():
+            # Another process may have refitted while this one waited
+            self.load()
+            return self.needs_refit() and self.refit()
+
+    def snapshot(self):
+        """Return the current vectorizer, adopting models other processes saved
+
+        Requests only fit when no model was ever saved, refitting a stale one
+        is left to refresh.
+        """
+        if not self.scorer.needs_corpus:
+            # Models that learn nothing from the corpus are built once and never refitted
+            if self.vectorizer is None:
+                self.vectorizer = self.scorer.fit(())
+            return self.vectorizer
+        self.load()
+        if self.vectorizer is None:
+            with self.locked():
+                self.load()
+                if self.vectorizer is None:
+                    self.refit()
+        return self.vectorizer
+
+def model_version(vectorizer):
+    """Version of a fitted vectorizer, 0 when there is none or it is not fitted to the corpus"""
+    return getattr(vectorizer, 'model_version', 0)
+
+# Bump when the score formula or the features it reads change
+SCORING_REVISION = 2
+
+def scoring_version(vectorizer):
+    """Version of everything stored features and scores depend on
+
+    Combines the scorer and its model with the skill taxonomy and the scoring
+    revision, so switching scorers, refitting the model, editing the taxonomy
+    or changing the formula all invalidate what was computed before.
+    """
+    key = (f'{match_scorer.name}:{model_version(vectorizer)}:{skill_index.current().version}:'
+           f'{SCORING_REVISION}')
+    return int(hashlib.sha1(key.encode()).hexdigest()[:15], 16)
+
+def job_text(job):
+    """Build the matching text for a row from the jobs table"""
+    return f"{job[2]} {job[3]} {job[4]} {job[5]}"
+
+def load_corpus():
+    """Load every job and resume text used to fit the match model"""
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM jobs')
+    documents = [job_text(job) for job in cursor.fetchall()]
+    cursor.execute('SELECT resume_text FROM resumes')
+    documents.extend(row[0] for row in cursor.fetchall())
+    return documents
+
+def extract_features(texts, vectorizer, skill_bits=None, experience=None):
+    """Extract the matching features of a batch of documents
+
+    skill_bits and experience may hold bitmasks and years of experience already
+    stored on the rows, one per text.
+    """
+    if vectorizer is not None:
+        tfidf = vectorizer.transform(texts)
+    else:
+        tfidf = csr_matrix((len(texts), 0), dtype=np.float32)
+    if skill_bits is None:
+        skill_bits = skill_bitsets([extract_skill_ids(text) for text in texts])
+    if experience is None:
+        experience = [experience_years(text) for text in texts]
+    return {
+        'tfidf': tfidf,
+        'skill_bits': np.asarray(skill_bits, dtype=np.uint64).reshape(
+            len(texts), skill_index.current().words),
+        'experience': np.asarray(experience, dtype=np.float32).reshape(len(texts))
     }
-    
-    # Combine all skills
-    all_skills = technical_skills.union(soft_skills).union(tools)
-    
-    # Convert text to lowercase for better matching
-    text_lower = text.lower()
-    
-    # Initialize found skills set
-    found_skills = set()
-    
-    # Extract single-word skills
-    words = re.findall(r'\b\w+\b', text_lower)
-    for word in words:
-        if word in all_skills:
-            found_skills.add(word)
-    
-    # Extract multi-word skills
-    for skill in all_skills:
-        if ' ' in skill and skill in text_lower:
-            found_skills.add(skill)
-    
-    # Look for common abbreviations
-    abbreviations = {
-        'ai': 'artificial intelligence',
-        'ml': 'machine learning',
-        'dl': 'deep learning',
-        'nlp': 'natural language processing',
-        'oop': 'object oriented programming',
-        'ui': 'user interface',
-        'ux': 'user experience',
-        'api': 'application programming interface',
-        'saas': 'software as a service',
-        'db': 'database'
+
+class JobFeatureStore:
+    """Append-only job feature files, memory-mapped when loaded
+
+    Each job contributes one TF-IDF row, its skill bitmask and its required
+    years of experience. Rows are appended when jobs are posted and the whole
+    store is only rebuilt when the match model or skill taxonomy changes.
+
+    Web and worker processes map the same files, so a file is never cut below
+    the rows meta.json committed. A rebuild writes a new generation directory
+    and publishes it by replacing meta.json. Writes hold an exclusive lock on
+    store.lock so processes append one at a time, loads hold a shared one so
+    they never map a generation while it is being replaced.
+    """
+
+    ARRAYS = {
+        'job_ids.bin': np.int64,
+        'row_nnz.bin': np.int64,
+        'indices.bin': np.int32,
+        'data.bin': np.float32,
+        'experience.bin': np.float32,
+        'skill_bits.bin': np.uint64,
     }
-    
-    for abbr, full_form in abbreviations.items():
-        if re.search(r'\b' + abbr + r'\b', text_lower, re.IGNORECASE):
-            found_skills.add(full_form)
-    
-    # Look for version-specific skills (e.g., Python 3, Java 8)
-    version_patterns = [
-        (r'python\s*[23]\b', 'python'),
-        (r'java\s*[8-9]\b', 'java'),
-        (r'angular\s*[2-9]\b', 'angular'),
-    ]
-    
-    for pattern, skill in version_patterns:
-        if re.search(pattern, text_lower):
-            found_skills.add(skill)
-    
-    return list(found_skills)
-    common_skills = {
-        'python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular',
-        'node.js', 'docker', 'kubernetes', 'aws', 'azure', 'machine learning',
-        'data analysis', 'project management', 'agile', 'scrum', 'leadership',
-        'communication', 'problem solving', 'teamwork', 'git', 'devops'
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.meta_path = os.path.join(folder, 'meta.json')
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.meta = None
+        self.generation = None
+        self.version = None
+        self.n_features = 0
+        self.skill_words = 1
+        self.nnz = 0
+        self.rows = {}
+        self.tfidf = csr_matrix((0, 0), dtype=np.float32)
+        self.skill_bits = np.zeros((0, 1), dtype=np.uint64)
+        self.experience = np.zeros(0, dtype=np.float32)
+
+    def path(self, name):
+        return os.path.join(self.folder, self.generation, name)
+
+    @contextmanager
+    def locked(self, exclusive=False):
+        """Access to the store across threads and, where fcntl exists, processes
+
+        Shared access may only load, exclusive access may also append and rebuild.
+        The thread lock guards this process's loaded state and is held briefly.
+        """
+        with self.lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.folder, 'store.lock'), 'a') as f:
+                # Released when the file is closed
+                fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                yield
+
+    def sizes(self, count, nnz):
+        """Number of committed values in each file for count rows"""
+        return {
+            'job_ids.bin': count, 'row_nnz.bin': count, 'experience.bin': count,
+            'indices.bin': nnz, 'data.bin': nnz, 'skill_bits.bin': count * self.skill_words,
+        }
+
+    def map_array(self, name, size):
+        if size == 0:
+            return np.zeros(0, dtype=self.ARRAYS[name])
+        return np.memmap(self.path(name), dtype=self.ARRAYS[name], mode='r', shape=(size,))
+
+    def load(self):
+        """Memory-map the committed features, unless they are mapped already
+
+        Compares the contents of meta.json rather than its mtime, which can miss
+        two commits within one clock tick.
+        """
+        try:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+        if meta == self.meta:
+            return
+        self.clear()
+        self.meta = meta
+        if meta is None:
+            return
+
+        count = meta['rows']
+        self.generation = meta['generation']
+        self.version = meta['version']
+        self.n_features = meta['n_features']
+        self.skill_words = meta['skill_words']
+
+        row_nnz = self.map_array('row_nnz.bin', count)
+        indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(row_nnz, out=indptr[1:])
+        self.nnz = int(indptr[-1])
+        if self.nnz < 2 ** 31:
+            # Matching index dtypes keeps scipy from copying the mapped indices
+            indptr = indptr.astype(np.int32)
+
+        sizes = self.sizes(count, self.nnz)
+        self.tfidf = csr_matrix(
+            (self.map_array('data.bin', sizes['data.bin']),
+             self.map_array('indices.bin', sizes['indices.bin']), indptr),
+            shape=(count, self.n_features)
+        )
+        self.experience = self.map_array('experience.bin', count)
+        self.skill_bits = self.map_array('skill_bits.bin', sizes['skill_bits.bin']).reshape(
+            count, self.skill_words)
+        self.rows = {int(job_id): row for row, job_id in enumerate(self.map_array('job_ids.bin', count))}
+
+    def append(self, job_ids, features):
+        """Append feature rows to the files, then commit them by rewriting meta.json
+
+        Callers hold the exclusive store lock and have just loaded, so the committed sizes
+        are current and truncating to them only drops an interrupted append.
+        """
+        count = len(self.rows)
+        committed = self.sizes(count, self.nnz)
+        tfidf = features['tfidf'].tocsr()
+        new_rows = {
+            'job_ids.bin': np.asarray(job_ids),
+            'row_nnz.bin': np.diff(tfidf.indptr),
+            'indices.bin': tfidf.indices,
+            'data.bin': tfidf.data,
+            'experience.bin': features['experience'],
+            'skill_bits.bin': features['skill_bits'],
+        }
+        for name, values in new_rows.items():
+            with open(self.path(name), 'ab') as f:
+                # Drop anything an interrupted append left behind
+                f.truncate(committed[name] * np.dtype(self.ARRAYS[name]).itemsize)
+                f.write(np.asarray(values, dtype=self.ARRAYS[name]).tobytes())
+
+        meta = {'generation': self.generation, 'version': self.version, 'n_features': self.n_features,
+                'skill_words': self.skill_words, 'rows': count + len(job_ids)}
+        with open(self.meta_path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(self.meta_path + '.tmp', self.meta_path)
+        self.load()
+
+    def add_jobs(self, jobs, vectorizer):
+        """Append the features of rows from the jobs table, reusing their stored skill bitmasks and years"""
+        self.append([job[0] for job in jobs], match_scorer.transform_jobs(
+            [job_text(job) for job in jobs], vectorizer,
+            [stored_skill_bits(job[8], job[9], job_text(job)) for job in jobs],
+            [job_experience_years(job) for job in jobs]))
+
+    def rebuild(self, vectorizer):
+        """Re-extract every job against a newly fitted model or taxonomy into a new generation"""
+        self.clear()
+        self.generation = f'jobs-{time.time_ns()}'
+        os.makedirs(os.path.join(self.folder, self.generation))
+        self.version = scoring_version(vectorizer)
+        self.n_features = match_scorer.n_features(vectorizer)
+        self.skill_words = skill_index.current().words
+
+        conn = get_db()
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM jobs')
+        jobs = cursor.fetchall()
+        # Always append, even nothing, so meta.json publishes the new generation
+        self.add_jobs(jobs, vectorizer)
+        self.remove_old_generations()
+
+    def remove_old_generations(self):
+        """Delete unpublished feature files, processes still mapping them keep their pages"""
+        for name in os.listdir(self.folder):
+            path = os.path.join(self.folder, name)
+            if name.startswith('jobs-') and name != self.generation:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def job_posted(self, job_id):
+        """Extract a newly posted job's features once, at write time"""
+        self.features([job_id])
+
+    def mapped(self, job_ids):
+        """Rows of the given jobs and the loaded arrays they index"""
+        return [self.rows[job_id] for job_id in job_ids], self.tfidf, self.skill_bits, self.experience
+
+    def features(self, job_ids):
+        """Return the model in use and the stored features of the given jobs"""
+        vectorizer = match_model.snapshot()
+        version = scoring_version(vectorizer)
+        with self.locked():
+            self.load()
+            current = self.version == version and all(job_id in self.rows for job_id in job_ids)
+            if current:
+                mapped = self.mapped(job_ids)
+
+        if not current:
+            # flock cannot upgrade atomically, so check again once the lock is exclusive
+            with self.locked(exclusive=True):
+                self.load()
+                if self.version != version:
+                    self.rebuild(vectorizer)
+
+                # Jobs inserted behind the store's back are added on first use
+                missing = [job_id for job_id in job_ids if job_id not in self.rows]
+                if missing:
+                    conn = get_db()
+                    cursor = conn.cursor()
+                    cursor.execute('SELECT * FROM jobs WHERE id IN (%s)' % ','.join('?' * len(missing)),
+                                   missing)
+                    self.add_jobs(cursor.fetchall(), vectorizer)
+                mapped = self.mapped(job_ids)
+
+        # Loading maps new arrays rather than changing these, so slicing needs no lock
+        rows, tfidf, skill_bits, experience = mapped
+        return vectorizer, {
+            'tfidf': tfidf[rows],
+            'skill_bits': np.asarray(skill_bits[rows]),
+            'experience': np.asarray(experience[rows])
+        }
+
+def skill_overlap(resume_bits, job_bits):
+    """Share of each job's skills found in each resume, as a bitwise AND plus popcount"""
+    matched = popcount(resume_bits[:, None, :] & job_bits[None, :, :])
+    required = popcount(job_bits)
+    return np.divide(matched, required, out=np.zeros(matched.shape), where=required > 0) * 100
+
+def experience_match(resume_years, required_years):
+    """Experience component for every resume against every job requirement
+
+    Full marks once a resume meets the requirement, otherwise the share of the
+    required years it covers. Jobs that require nothing match every resume.
+    """
+    resume_years = np.asarray(resume_years, dtype=float)[:, None]
+    required_years = np.asarray(required_years, dtype=float)[None, :]
+    ratio = np.divide(resume_years, required_years,
+                      out=np.ones(np.broadcast_shapes(resume_years.shape, required_years.shape)),
+                      where=required_years > 0)
+    return np.minimum(ratio, 1) * 100
+
+# Score components for every resume x job pair of two feature batches
+SCORE_COMPONENTS = {
+    # Share of the job's skills found in the resume
+    'skills': lambda resumes, jobs: skill_overlap(resumes['skill_bits'], jobs['skill_bits']),
+    # Text similarity as one resumes x jobs product of the text vectors
+    'similarity': lambda resumes, jobs: (resumes['tfidf'] @ jobs['tfidf'].T).toarray() * 100,
+    # How much of the required experience the resume covers
+    'experience': lambda resumes, jobs: experience_match(resumes['experience'], jobs['experience']),
+}
+
+class Scorer:
+    """Matching strategy, how texts become features and features become match percentages
+
+    fit learns the text model from the corpus, transform_jobs and transform_resumes
+    turn texts into feature batches and score_batch scores every resume x job pair
+    of two batches. Feature batches always hold 'tfidf' text vectors (whatever
+    their weighting, empty without a text model), 'skill_bits' and 'experience',
+    so the job store and resume cache work with every strategy.
+    """
+
+    name = None
+    # Whether fit learns from the corpus, other models are built once and never refitted
+    needs_corpus = True
+    # Score components and their weights in the final match percentage
+    weights = {}
+
+    def fit(self, documents):
+        """Fitted text model, None without one. Raises ValueError when documents teach it nothing"""
+        raise NotImplementedError
+
+    def n_features(self, model):
+        """Width of the text vectors the model produces"""
+        return len(model.vocabulary_) if model is not None else 0
+
+    def transform_jobs(self, texts, model, skill_bits=None, experience=None):
+        """Features of job texts, skill_bits and experience may hold values stored on the rows"""
+        return extract_features(texts, model, skill_bits, experience)
+
+    def transform_resumes(self, texts, model, skill_bits=None, experience=None):
+        """Features of resume texts, skill_bits and experience may hold values stored on the rows"""
+        return extract_features(texts, model, skill_bits, experience)
+
+    def components(self, resumes, jobs):
+        """The weighted score components for every resume x job pair"""
+        return {name: SCORE_COMPONENTS[name](resumes, jobs) for name in self.weights}
+
+    def combine(self, components):
+        """Combine score components into the final match percentage"""
+        total = sum(components[name] * weight for name, weight in self.weights.items())
+        return np.round(np.asarray(total, dtype=float), 2)
+
+    def score_batch(self, resumes, jobs):
+        """Match percentage of every resume x job pair of two feature batches"""
+        return self.combine(self.components(resumes, jobs))
+
+class TfidfScorer(Scorer):
+    """TF-IDF similarity, skill overlap and experience, the default"""
+
+    name = 'tfidf'
+    weights = {
+        'skills': 0.4,       # Skills are important
+        'similarity': 0.4,   # Overall content similarity
+        'experience': 0.2,   # Experience requirements
     }
 
-    extracted_skills = set()
-    text_lower = text.lower()
-
-    for skill in common_skills:
-        if skill in text_lower:
-            extracted_skills.add(skill.title())
-
-    return list(extracted_skills)
-
-def extract_education(text):
-    education_patterns = [
-        r'(?i)(?:B\.?Tech|Bachelor of Technology)',
-        r'(?i)(?:M\.?Tech|Master of Technology)',
-        r'(?i)(?:B\.?E|Bachelor of Engineering)',
-        r'(?i)(?:M\.?S|Master of Science)',
-        r'(?i)(?:B\.?Sc|Bachelor of Science)',
-        r'(?i)(?:Ph\.?D|Doctor of Philosophy)',
-        r'(?i)(?:MBA|Master of Business Administration)'
-    ]
-
-    education = []
-    for pattern in education_patterns:
-        matches = re.findall(pattern, text)
-        education.extend(matches)
-
-    return list(set(education))
-
-def extract_experience(text):
-    # Simple extraction of years of experience
-    experience_patterns = [
-        r'(\d+)\+?\s+years?\s+(?:of\s+)?experience',
-        r'experience\s+(?:of\s+)?(\d+)\+?\s+years?'
-    ]
-
-    for pattern in experience_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1) + " years"
-
-    return "Not specified"
-
-def calculate_match_percentage(resume_text, job_description):
-    """Calculate match percentage between resume and job description"""
-    vectorizer = TfidfVectorizer(
-        stop_words='english',
-        ngram_range=(1, 2),  # Consider both single words and pairs of words
-        max_features=5000,    # Increase vocabulary size
-        analyzer='word'
-    )
-    
-    # Extract skills from both resume and job description
-    resume_skills = extract_skills(resume_text)
-    job_skills = extract_skills(job_description)
-    
-    # Calculate skills match
-    if job_skills:
-        skills_match = len(set(resume_skills) & set(job_skills)) / len(job_skills) * 100
+    def fit(self, documents):
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),  # Consider both single words and pairs of words
+            max_features=5000,    # Increase vocabulary size
+            analyzer='word',
+            dtype=np.float32
+        )
+        return vectorizer.fit(documents)
+
+class HashedScorer(TfidfScorer):
+    """The default's components over hashed term frequencies, nothing to fit or refit"""
+
+    name = 'hashed'
+    needs_corpus = False
+    n_hashed_features = 2 ** 18
+
+    def fit(self, documents):
+        return HashingVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            n_features=self.n_hashed_features,
+            alternate_sign=False,
+            dtype=np.float32
+        )
+
+    def n_features(self, model):
+        return model.n_features
+
+class BM25Vectorizer:
+    """Okapi BM25 weights of job terms, with resumes as queries of the terms they contain"""
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.counts = CountVectorizer(stop_words='english', ngram_range=(1, 2), max_features=5000,
+                                      dtype=np.float32)
+
+    def fit(self, documents):
+        counts = self.counts.fit_transform(documents).tocsr()
+        doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+        self.idf = np.log1p((counts.shape[0] - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+        self.average_length = max(counts.sum() / counts.shape[0], 1.0)
+        self.vocabulary_ = self.counts.vocabulary_
+        return self
+
+    def transform(self, texts):
+        """BM25 term weights of each text, each row summing to 1"""
+        counts = self.counts.transform(texts).tocsr()
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        row_lengths = np.repeat(lengths, np.diff(counts.indptr))
+        saturation = self.k1 * (1 - self.b + self.b * row_lengths / self.average_length)
+        counts.data = counts.data * (self.k1 + 1) / (counts.data + saturation) * self.idf[counts.indices]
+        return normalize(counts, norm='l1')
+
+    def transform_queries(self, texts):
+        """Which vocabulary terms each text contains, as 0/1 rows"""
+        counts = self.counts.transform(texts).tocsr()
+        counts.data[:] = 1
+        return counts
+
+class BM25Scorer(Scorer):
+    """Share of a job's BM25 term weight found in the resume, text only"""
+
+    name = 'bm25'
+    weights = {'similarity': 1.0}
+
+    def fit(self, documents):
+        return BM25Vectorizer().fit(documents)
+
+    def transform_resumes(self, texts, model, skill_bits=None, experience=None):
+        features = extract_features(texts, None, skill_bits, experience)
+        if model is not None:
+            features['tfidf'] = model.transform_queries(texts)
+        return features
+
+class SkillsScorer(Scorer):
+    """Share of the job's skills found in the resume, no text model"""
+
+    name = 'skills'
+    needs_corpus = False
+    weights = {'skills': 1.0}
+
+    def fit(self, documents):
+        return None
+
+SCORERS = {
+    'tfidf': TfidfScorer,
+    'bm25': BM25Scorer,
+    'skills': SkillsScorer,
+    'hashed': HashedScorer,
+}
+
+def get_scorer(name):
+    """Instantiate the registered scorer called name"""
+    if name not in SCORERS:
+        raise ValueError(f"Unknown match scorer {name!r}, expected one of {', '.join(SCORERS)}")
+    return SCORERS[name]()
+
+match_scorer = get_scorer(MATCH_SCORER)
+match_model = MatchModel(os.path.join(FEATURE_FOLDER, 'match_model.pkl'), match_scorer)
+job_store = JobFeatureStore(FEATURE_FOLDER)
+
+def save_match_scores(user_ids, job_ids, components, version, invalidate=None):
+    """Store the score of every user x job pair in the match_scores cache
+
+    invalidate is a ('user_id' or 'job_id', value) pair whose old rows are
+    dropped in the same transaction.
+    """
+    scores = match_scorer.combine(components)
+    rows = []
+    for i, user_id in enumerate(user_ids):
+        for j, job_id in enumerate(job_ids):
+            parts = {name: round(float(values[i, j]), 2) for name, values in components.items()}
+            rows.append((user_id, job_id, float(scores[i, j]), json.dumps(parts), version))
+
+    with db_write() as cursor:
+        if invalidate:
+            column, value = invalidate
+            cursor.execute(f'DELETE FROM match_scores WHERE {column} = ?', (value,))
+        cursor.executemany('''
+            INSERT OR REPLACE INTO match_scores (user_id, job_id, score, components, model_version)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows)
+    return scores
+
+def refresh_resume_scores(cursor, user_id, resume_text, job_ids=None):
+    """Score a resume against jobs (all of them by default) and cache the results"""
+    invalidate = None
+    if job_ids is None:
+        invalidate = ('user_id', user_id)
+        cursor.execute('SELECT id FROM jobs')
+        job_ids = [row[0] for row in cursor.fetchall()]
+    if not job_ids:
+        return {}
+
+    vectorizer, jobs = job_store.features(job_ids)
+    components = match_scorer.components(match_scorer.transform_resumes([resume_text], vectorizer), jobs)
+    scores = save_match_scores([user_id], job_ids, components, scoring_version(vectorizer),
+                               invalidate)
+    return dict(zip(job_ids, scores[0].tolist()))
+
+def refresh_job_scores(job_id):
+    """Score a job against every resume, cache the results and return their version
+
+    Resume features come from the resume cache, which only re-extracts
+    resumes changed since its last sync.
+    """
+    vectorizer, jobs = job_store.features([job_id])
+    version = scoring_version(vectorizer)
+    user_ids, resume_features = resume_cache.all_resumes(vectorizer, jobs['tfidf'].shape[1])
+    if user_ids:
+        components = match_scorer.components(resume_features, jobs)
+        save_match_scores(user_ids, [job_id], components, version, ('job_id', job_id))
+    return version
+
+def get_match_scores(cursor, user_id, resume_text, job_ids):
+    """Read cached match scores, scoring and caching any that are missing or stale"""
+    version = scoring_version(match_model.snapshot())
+    if len(job_ids) == 1:
+        cursor.execute('''
+            SELECT job_id, score FROM match_scores
+            WHERE user_id = ? AND job_id = ? AND model_version = ?
+        ''', (user_id, job_ids[0], version))
     else:
-        skills_match = 0
-        
-    # Calculate text similarity using TF-IDF
-    try:
-        documents = [resume_text, job_description]
-        tfidf_matrix = vectorizer.fit_transform(documents)
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0] * 100
-    except:
-        similarity = 0
-        
-    # Extract experience from both documents
-    resume_experience = extract_experience(resume_text)
-    required_experience = extract_experience(job_description)
-    
-    # Calculate experience match
-    experience_match = 100 if resume_experience >= required_experience else (resume_experience / required_experience * 100 if required_experience > 0 else 100)
-    
-    # Calculate weighted average
-    final_match = (
-        skills_match * 0.4 +      # Skills are important
-        similarity * 0.4 +        # Overall content similarity
-        experience_match * 0.2    # Experience requirements
-    )
-    
-    return round(final_match, 2)
+        cursor.execute('''
+            SELECT job_id, score FROM match_scores
+            WHERE user_id = ? AND model_version = ?
+        ''', (user_id, version))
+    scores = dict(cursor.fetchall())
+
+    missing = [job_id for job_id in job_ids if job_id not in scores]
+    if missing:
+        scores.update(refresh_resume_scores(cursor, user_id, resume_text, missing))
+    return scores
+
+def top_candidate_scores(cursor, job_id, k):
+    """Return (score, user_id) pairs for the k best resumes for a job
+
+    Every resume is scored against a job when either is saved, so this reads
+    the cached scores in ranking order. After a model or taxonomy change the
+    job is scored against every resume again first.
+    """
+    version = scoring_version(match_model.snapshot())
+    cursor.execute('''
+        SELECT (SELECT COUNT(*) FROM match_scores WHERE job_id = ? AND model_version = ?),
+               (SELECT COUNT(DISTINCT user_id) FROM resumes)
+    ''', (job_id, version))
+    scored, resumes = cursor.fetchone()
+    if scored < resumes:
+        version = refresh_job_scores(job_id)
+
+    cursor.execute('''
+        SELECT score, user_id FROM match_scores
+        WHERE job_id = ? AND model_version = ?
+        ORDER BY score DESC, user_id
+        LIMIT ?
+    ''', (job_id, version, k))
+    return cursor.fetchall()
+
+class ResumeCache:
+    """Extracted features of every resume, kept in step with the resumes table
+
+    Scoring a new job against every resume reuses these instead of
+    extracting each resume's features again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.synced_at = None
+        self.resumes = {}  # user_id -> (tfidf indices, tfidf data, skill bits, experience)
+
+    def sync(self, vectorizer):
+        """Extract resumes changed since the last sync, or all of them after a version change"""
+        version = scoring_version(vectorizer)
+        if version != self.version:
+            self.resumes = {}
+            self.version = version
+            self.synced_at = None
+
+        conn = get_db()
+        cursor = conn.cursor()
+        started_at = time.time()
+        if self.synced_at is None:
+            cursor.execute('''
+                SELECT user_id, resume_text, skill_bits, skills_version, experience_years FROM resumes
+            ''')
+        else:
+            # Overlap by a second so writes racing the last sync are not missed
+            cursor.execute('''
+                SELECT user_id, resume_text, skill_bits, skills_version, experience_years FROM resumes
+                WHERE updated_at >= ?
+            ''', (self.synced_at - 1,))
+        resumes = cursor.fetchall()
+
+        if resumes:
+            features = match_scorer.transform_resumes(
+                [resume[1] for resume in resumes], vectorizer,
+                [stored_skill_bits(resume[2], resume[3], resume[1]) for resume in resumes],
+                [stored_experience_years(resume[4], resume[1]) for resume in resumes])
+            tfidf = features['tfidf'].tocsr()
+            for row, resume in enumerate(resumes):
+                vector = tfidf[row]
+                self.resumes[resume[0]] = (vector.indices, vector.data,
+                                           features['skill_bits'][row], features['experience'][row])
+        self.synced_at = started_at
+
+    def all_resumes(self, vectorizer, n_features):
+        """IDs and feature batch of every resume, None for the batch when there are none"""
+        with self.lock:
+            self.sync(vectorizer)
+            user_ids = list(self.resumes)
+            entries = [self.resumes[user_id] for user_id in user_ids]
+        if not entries:
+            return [], None
+        return user_ids, self.batch(entries, n_features)
+
+    def batch(self, entries, n_features):
+        """Feature batch of cache entries, their TF-IDF rows assembled directly into one CSR matrix"""
+        indptr = np.zeros(len(entries) + 1, dtype=np.int64)
+        np.cumsum([len(entry[0]) for entry in entries], out=indptr[1:])
+        tfidf = csr_matrix((np.concatenate([entry[1] for entry in entries]),
+                            np.concatenate([entry[0] for entry in entries]), indptr),
+                           shape=(len(entries), n_features))
+        return {
+            'tfidf': tfidf,
+            'skill_bits': np.stack([entry[2] for entry in entries]),
+            'experience': np.array([entry[3] for entry in entries]),
+        }
+
+resume_cache = ResumeCache()
+MAX_TOP_CANDIDATES = 100
 
 def get_user_id(username):
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('SELECT id FROM users WHERE username = ?', (username,))
     user = cursor.fetchone()
-    conn.close()
 
     if user:
         return user[0]
     return None
-# Helper function to check allowed file extensions
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
-# HTML Templates
-home_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CareerSync AI</title>
-    <style>
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes float {
-            0% { transform: translateY(0px); }
-            50% { transform: translateY(-20px); }
-            100% { transform: translateY(0px); }
-        }
-
-        @keyframes shine {
-            0% { background-position: -200% center; }
-            100% { background-position: 200% center; }
-        }
-
-        @keyframes slideInLeft {
-            from { transform: translateX(-100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes slideInRight {
-            from { transform: translateX(100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-
-        @keyframes rotateIn {
-            from { transform: rotate(-180deg); opacity: 0; }
-            to { transform: rotate(0); opacity: 1; }
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: 
-                linear-gradient(120deg, rgba(0,0,0,0.8), rgba(0,0,0,0.5)),
-                url('https://images.unsplash.com/photo-1454165804606-c3d57bc86b40?ixlib=rb-1.2.1');
-            background-size: cover;
-            background-attachment: fixed;
-            background-position: center;
-            color: #fff;
-            min-height: 100vh;
-        }
-
-        nav {
-            display: flex;
-            justify-content: space-between;
-            padding: 20px 40px;
-            background: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(10px);
-            position: fixed;
-            width: 100%;
-            top: 0;
-            z-index: 1000;
-            box-sizing: border-box;
-        }
-
-        .nav-links {
-            display: flex;
-            gap: 20px;
-        }
-
-        .nav-button {
-            color: #fff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 25px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-            background: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-
-        .nav-button:hover {
-            background: rgba(255, 255, 255, 0.2);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        .nav-button.primary {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            border: none;
-        }
-
-        .nav-button.primary:hover {
-            background: linear-gradient(45deg, #00ff9d, #00d4ff);
-        }
-
-        .hero {
-            text-align: center;
-            padding: 180px 20px 100px;
-            animation: fadeIn 1s ease-out;
-            background: rgba(0, 0, 0, 0.4);
-            backdrop-filter: blur(5px);
-        }
-
-        .hero h1 {
-            font-size: 4.5rem;
-            margin-bottom: 20px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            animation: float 6s ease-in-out infinite;
-        }
-
-        .hero p {
-            font-size: 1.5rem;
-            margin-bottom: 40px;
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-            animation-delay: 0.5s;
-        }
 
-        .hero .btn {
-            padding: 15px 40px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: #fff;
-            text-decoration: none;
-            border-radius: 30px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            display: inline-block;
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-            animation-delay: 1s;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .hero .btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .hero .btn:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-        }
-
-        section {
-            padding: 80px 20px;
-            text-align: center;
-            background: rgba(0, 0, 0, 0.7);
-            margin: 20px;
-            border-radius: 20px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-        }
-
-        section h2 {
-            font-size: 2.5rem;
-            margin-bottom: 40px;
-            color: #fff;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-
-        ul, ol {
-            list-style: none;
-            padding: 0;
-            max-width: 800px;
-            margin: 0 auto;
-        }
-
-        li {
-            margin: 20px 0;
-            padding: 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            transition: transform 0.3s ease;
-            cursor: pointer;
-        }
-
-        li:hover {
-            transform: scale(1.05);
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        .title-highlight {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: bold;
-            display: inline-block;
-        }
+# Lists are served in pages, ordered by a key the next page resumes after
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+RECENT_APPLICANTS = 10  # applicants in the recruiter dashboard's recent list
 
-        .feature-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }
+def page_size(default=PAGE_SIZE):
+    """Page size requested with ?limit=, clamped to MAX_PAGE_SIZE"""
+    return min(max(request.args.get('limit', default, type=int), 1), MAX_PAGE_SIZE)
 
-        .feature-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
+def encode_cursor(*key):
+    """Opaque token for the sort key of the last row on a page"""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
 
-        .feature-card:hover {
-            transform: translateY(-10px);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(255, 255, 255, 0.3);
-        }
+def decode_cursor(name, length):
+    """Sort key passed as ?<name>=, None when absent or malformed"""
+    token = request.args.get(name)
+    if not token:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(key, list) or len(key) != length:
+        return None
+    # Only values SQLite can bind, a forged cursor must not reach the query
+    for value in key:
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            return None
+        if isinstance(value, int) and not -2 ** 63 <= value < 2 ** 63:
+            return None
+    return key
+
+def jobs_page(cursor, after, limit):
+    """Jobs in posting order after the job ID cursor, with the next page's cursor"""
+    cursor.execute('SELECT * FROM jobs WHERE id > ? ORDER BY id LIMIT ?',
+                   (after[0] if after else 0, limit + 1))
+    jobs = cursor.fetchall()
+    next_cursor = encode_cursor(jobs[limit - 1][0]) if len(jobs) > limit else None
+    return jobs[:limit], next_cursor
 
-        @media (max-width: 768px) {
-            .hero h1 {
-                font-size: 3rem;
-            }
-            
-            nav {
-                padding: 15px 20px;
-            }
-            
-            .nav-links {
-                gap: 10px;
-            }
-            
-            .nav-button {
-                padding: 8px 15px;
-                font-size: 0.9rem;
-            }
-            
-            section {
-                margin: 10px;
-                padding: 40px 15px;
-            }
-        }
+def ranked_jobs_page(cursor, user_id, resume_text, after, limit):
+    """Jobs ranked by match score for a user after the (score, job ID) cursor
 
-        .cta-buttons {
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            margin-top: 30px;
-        }
+    Every job is scored before the page is read, so the ranking is global
+    across pages rather than per page.
+    """
+    version = scoring_version(match_model.snapshot())
+    cursor.execute('''
+        SELECT j.id FROM jobs j
+        LEFT JOIN match_scores m ON m.user_id = ? AND m.job_id = j.id AND m.model_version = ?
+        WHERE m.job_id IS NULL
+    ''', (user_id, version))
+    missing = [row[0] for row in cursor.fetchall()]
+    if missing:
+        refresh_resume_scores(cursor, user_id, resume_text, missing)
+
+    query = '''
+        SELECT j.id, j.company_name, j.role_name, j.description, j.qualifications,
+               j.experience, j.location, m.score
+        FROM match_scores m
+        JOIN jobs j ON j.id = m.job_id
+        WHERE m.user_id = ? AND m.model_version = ?
+    '''
+    params = [user_id, version]
+    if after:
+        query += ' AND (m.score < ? OR (m.score = ? AND m.job_id > ?))'
+        params += [after[0], after[0], after[1]]
+    cursor.execute(query + ' ORDER BY m.score DESC, m.job_id LIMIT ?', params + [limit + 1])
+    rows = cursor.fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(rows[limit - 1][7], rows[limit - 1][0])
+        rows = rows[:limit]
+
+    # Load which of these jobs the user has already applied for in one query
+    applied_job_ids = set()
+    if rows:
+        job_ids = [row[0] for row in rows]
+        cursor.execute('SELECT job_id FROM applications WHERE user_id = ? AND job_id IN (%s)' % ','.join('?' * len(job_ids)),
+                       [user_id] + job_ids)
+        applied_job_ids = {row[0] for row in cursor.fetchall()}
+
+    jobs = [{
+        'id': row[0],
+        'company_name': row[1],
+        'role_name': row[2],
+        'description': row[3],
+        'qualifications': row[4],
+        'experience': row[5],
+        'location': row[6],
+        'match_percentage': row[7],
+        'applied': row[0] in applied_job_ids
+    } for row in rows]
+    return jobs, next_cursor
+
+def applicants_page(cursor, recruiter_id, before, limit):
+    """A recruiter's applicants, newest first, before the (date, application ID) cursor"""
+    query = '''
+        SELECT a.id, u.username, j.role_name, a.match_percentage,
+               datetime(a.application_date) as app_date, a.status, a.application_date
+        FROM applications a
+        JOIN users u ON a.user_id = u.id
+        JOIN jobs j ON a.job_id = j.id
+        WHERE j.posted_by = ?
+    '''
+    params = [recruiter_id]
+    if before:
+        query += ' AND (a.application_date < ? OR (a.application_date = ? AND a.id < ?))'
+        params += [before[0], before[0], before[1]]
+    cursor.execute(query + ' ORDER BY a.application_date DESC, a.id DESC LIMIT ?', params + [limit + 1])
+    rows = cursor.fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(rows[limit - 1][6], rows[limit - 1][0])
+        rows = rows[:limit]
+
+    applicants = [{
+        'id': applicant[0],
+        'username': applicant[1],
+        'role_name': applicant[2],
+        'match_percentage': applicant[3],
+        'application_date': applicant[4],
+        'status': applicant[5]
+    } for applicant in rows]
+    return applicants, next_cursor
+# Helper function to check allowed file extensions
+def allowed_file(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-        .cta-btn {
-            padding: 15px 30px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: #fff;
-            text-decoration: none;
-            border-radius: 30px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            animation: pulse 2s infinite;
-        }
+# Uploaded resumes are processed by background workers through a durable queue
+# table, so upload latency does not depend on the size of the PDF
+RESUME_WORKERS = 2
+RESUME_POLL_INTERVAL = 1.0  # seconds an idle worker waits before checking the queue again
+RESUME_JOB_TIMEOUT = 300  # seconds before a job claimed by a dead worker is retried
+RESUME_JOB_MAX_ATTEMPTS = 3
+RESUME_WORKER_STOP_TIMEOUT = 10  # seconds workers get to finish their current job on shutdown
+
+def save_upload(file, user_id):
+    """Stream an uploaded file into a new file in the upload folder, hashing it on the way
+
+    Returns the path and SHA-256 hex digest of the saved file, or None when it is
+    larger than MAX_UPLOAD_SIZE.
+    """
+    extension = file.filename.rsplit('.', 1)[1].lower()
+    # mkstemp picks a name no other upload can be using
+    fd, filepath = tempfile.mkstemp(suffix='.' + extension, prefix=f'{user_id}_',
+                                    dir=app.config['UPLOAD_FOLDER'])
+    content_hash = hashlib.sha256()
+    size = 0
+    with os.fdopen(fd, 'wb') as saved:
+        while True:
+            chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE:
+                break
+            content_hash.update(chunk)
+            saved.write(chunk)
+    if size > MAX_UPLOAD_SIZE:
+        remove_upload(filepath)
+        return None
+    return filepath, content_hash.hexdigest()
+
+def enqueue_resume(user_id, filepath, content_hash=None):
+    """Queue an uploaded resume file for processing and return the job ID"""
+    now = time.time()
+    with db_write() as cursor:
+        cursor.execute('''
+            INSERT INTO resume_jobs (user_id, filepath, content_hash, status, created_at, updated_at)
+            VALUES (?, ?, ?, 'queued', ?, ?)
+        ''', (user_id, filepath, content_hash, now, now))
+        return cursor.lastrowid
+
+def claim_resume_job():
+    """Mark the oldest runnable job as processing and return it, None when the queue is empty"""
+    now = time.time()
+    with db_write() as cursor:
+        while True:
+            cursor.execute('''
+                SELECT id, user_id, filepath, attempts, content_hash FROM resume_jobs
+                WHERE status = 'queued' OR (status = 'processing' AND updated_at < ?)
+                ORDER BY id LIMIT 1
+            ''', (now - RESUME_JOB_TIMEOUT,))
+            job = cursor.fetchone()
+            if not job:
+                return None
+            if job[3] < RESUME_JOB_MAX_ATTEMPTS:
+                cursor.execute('''
+                    UPDATE resume_jobs SET status = 'processing', attempts = attempts + 1, updated_at = ?
+                    WHERE id = ?
+                ''', (now, job[0]))
+                return job
+            # Give up on a job that keeps killing its worker
+            cursor.execute('''
+                UPDATE resume_jobs SET status = 'failed', error = ?, updated_at = ? WHERE id = ?
+            ''', ('Processing did not finish', now, job[0]))
+            remove_upload(job[2])
 
-        .cta-btn:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-        }
+def finish_resume_job(job_id, status, error=None):
+    with db_write() as cursor:
+        cursor.execute('UPDATE resume_jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?',
+                       (status, error, time.time(), job_id))
 
-        .testimonials {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
+def remove_upload(filepath):
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
 
-        .testimonial-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            transition: all 0.3s ease;
-            animation: fadeIn 0.5s ease-out forwards;
-        }
+def save_resume(job_id, user_id, resume_analysis):
+    """Store an analyzed resume, unless a newer upload by the same user already finished"""
+    with db_write() as cursor:
+        cursor.execute('''
+            SELECT 1 FROM resume_jobs WHERE user_id = ? AND id > ? AND status = 'done'
+        ''', (user_id, job_id))
+        if cursor.fetchone():
+            return False
 
-        .testimonial-card:hover {
-            transform: translateY(-10px);
-            background: rgba(255, 255, 255, 0.2);
-        }
+        # Check if user already has a resume
+        cursor.execute('SELECT id FROM resumes WHERE user_id = ?', (user_id,))
+        existing_resume = cursor.fetchone()
 
-        .why-us-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
+        if existing_resume:
+            # Update existing resume
+            cursor.execute('''
+                UPDATE resumes
+                SET resume_text = ?, skills = ?, education = ?, experience = ?, experience_years = ?,
+                    skill_bits = ?, skills_version = ?, updated_at = ?
+                WHERE user_id = ?
+            ''', (
+                resume_analysis['full_text'],
+                ','.join(resume_analysis['skills']),
+                ','.join(resume_analysis['education']),
+                resume_analysis['experience'],
+                resume_analysis['experience_years'],
+                resume_analysis['skill_bits'].tobytes(),
+                skill_index.current().version,
+                time.time(),
+                user_id
+            ))
+        else:
+            # Insert new resume
+            cursor.execute('''
+                INSERT INTO resumes (user_id, resume_text, skills, education, experience,
+                                     experience_years, skill_bits, skills_version, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                user_id,
+                resume_analysis['full_text'],
+                ','.join(resume_analysis['skills']),
+                ','.join(resume_analysis['education']),
+                resume_analysis['experience'],
+                resume_analysis['experience_years'],
+                resume_analysis['skill_bits'].tobytes(),
+                skill_index.current().version,
+                time.time()
+            ))
+    return True
 
-        .why-us-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 25px;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-            animation: slideInRight 0.5s ease-out forwards;
-        }
+def cached_resume_analysis(content_hash):
+    """Analysis of a previously processed file with the same content, None if there is none
 
-        .why-us-card:hover {
-            transform: translateY(-5px) scale(1.02);
-            background: rgba(255, 255, 255, 0.2);
-        }
+    Skips PDF parsing. Analyses made by older extractors or skill taxonomies are
+    redone from the cached text, unless the text itself is outdated.
+    """
+    cursor = get_db().cursor()
+    cursor.execute('''
+        SELECT resume_text, skills, education, experience, skill_bits, skills_version, extractor_version,
+               experience_years
+        FROM resume_extractions WHERE content_hash = ?
+    ''', (content_hash,))
+    cached = cursor.fetchone()
+    if not cached or cached[6] < RESUME_TEXT_VERSION:
+        return None
+
+    if cached[5] != skill_index.current().version or cached[6] != RESUME_EXTRACTOR_VERSION:
+        resume_analysis = analyze_resume_text(cached[0])
+        cache_resume_analysis(content_hash, resume_analysis)
+        return resume_analysis
 
-        .process-steps {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
+    return {
+        'skills': cached[1].split(',') if cached[1] else [],
+        'skill_bits': np.frombuffer(cached[4], dtype=np.uint64),
+        'education': cached[2].split(',') if cached[2] else [],
+        'experience': cached[3],
+        'experience_years': cached[7],
+        'full_text': cached[0]
+    }
 
-        .process-step {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-            animation: rotateIn 0.5s ease-out forwards;
-        }
+def cache_resume_analysis(content_hash, resume_analysis):
+    with db_write() as cursor:
+        cursor.execute('''
+            INSERT OR REPLACE INTO resume_extractions (content_hash, resume_text, skills, education,
+                experience, experience_years, skill_bits, skills_version, extractor_version, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            content_hash,
+            resume_analysis['full_text'],
+            ','.join(resume_analysis['skills']),
+            ','.join(resume_analysis['education']),
+            resume_analysis['experience'],
+            resume_analysis['experience_years'],
+            resume_analysis['skill_bits'].tobytes(),
+            skill_index.current().version,
+            RESUME_EXTRACTOR_VERSION,
+            time.time()
+        ))
+
+def process_resume_job(job_id, user_id, filepath, content_hash=None):
+    """Analyze a queued resume, store it and precompute its match scores"""
+    try:
+        resume_analysis = cached_resume_analysis(content_hash) if content_hash else None
+        if resume_analysis is None:
+            resume_analysis = analyze_resume(filepath)
+            # Files no text came out of are not cached, the failure may not repeat
+            if content_hash and resume_analysis['full_text']:
+                cache_resume_analysis(content_hash, resume_analysis)
+        if save_resume(job_id, user_id, resume_analysis):
+            # Replace the cached scores of the previous resume
+            refresh_resume_scores(get_db().cursor(), user_id, resume_analysis['full_text'])
+        finish_resume_job(job_id, 'done')
+    except Exception as e:
+        print(f"Error processing resume job {job_id}: {e}")
+        finish_resume_job(job_id, 'failed', str(e))
+    finally:
+        remove_upload(filepath)
+
+def process_pending_resumes():
+    """Process queued resumes in this process until the queue is empty"""
+    processed = 0
+    while True:
+        job = claim_resume_job()
+        if not job:
+            return processed
+        process_resume_job(job[0], job[1], job[2], job[4])
+        processed += 1
+
+def resume_worker(stop):
+    """Worker process loop that processes queued resumes until stopped or orphaned
+
+    While idle it also refits the match model once enough documents were added
+    and rebuilds the job features for it.
+    """
+    parent = os.getppid()
+    checked_at = float('-inf')
+    while not stop.is_set() and os.getppid() == parent:
+        job = claim_resume_job()
+        if job:
+            process_resume_job(job[0], job[1], job[2], job[4])
+        elif time.monotonic() - checked_at > MODEL_CHECK_INTERVAL:
+            checked_at = time.monotonic()
+            try:
+                if match_model.refresh():
+                    # Re-extract the stored job features now rather than in a request
+                    job_store.features([])
+            except Exception as e:
+                print(f"Error refitting match model: {e}")
+        else:
+            # Sleep rather than wait on the event, a killed waiter would leave set() blocked
+            time.sleep(RESUME_POLL_INTERVAL)
+    extraction_pool.reset()
+
+def start_resume_workers(count=RESUME_WORKERS):
+    # Not daemons, daemonic processes may not start the PDF extraction pool
+    stop = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=resume_worker, args=(stop,)) for _ in range(count)]
+    for worker in workers:
+        worker.start()
+    atexit.register(stop_resume_workers, stop, workers)
+    return workers
+
+def stop_resume_workers(stop, workers):
+    """Let workers finish their current resume, terminating any that take too long"""
+    stop.set()
+    deadline = time.monotonic() + RESUME_WORKER_STOP_TIMEOUT
+    for worker in workers:
+        worker.join(max(deadline - time.monotonic(), 0))
+        if worker.is_alive():
+            worker.terminate()
+
+@app.cli.command('resume-worker')
+def resume_worker_command():
+    """Run resume processing workers in the foreground"""
+    for worker in start_resume_workers():
+        worker.join()
+
+@app.cli.command('refit-model')
+def refit_model_command():
+    """Refit the match model if documents were added since it was fitted, e.g. from cron"""
+    if match_model.refresh():
+        job_store.features([])
+        print(f"Refitted the match model over {match_model.fitted_docs} documents")
+    else:
+        print("The match model is up to date")
 
-        .process-step:hover {
-            transform: scale(1.05);
-            background: rgba(255, 255, 255, 0.2);
-        }
-    </style>
+# HTML Templates
+home_page = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>CareerSync AI</title>
+    <link rel="stylesheet" href="{{ asset_url('css/home.css') }}">
 </head>
 <body>
     <nav>
@@ -787,633 +2271,7 @@ job_seeker_dashboard = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Job Seeker Dashboard - CareerSync AI</title>
-    <style>
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes float {
-            0% { transform: translateY(0px); }
-            50% { transform: translateY(-10px); }
-            100% { transform: translateY(0px); }
-        }
-
-        @keyframes shine {
-            0% { background-position: -200% center; }
-            100% { background-position: 200% center; }
-        }
-
-        @keyframes slideInLeft {
-            from { transform: translateX(-100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes slideInRight {
-            from { transform: translateX(100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: 
-                linear-gradient(120deg, rgba(0,0,0,0.8), rgba(0,0,0,0.5)),
-                url('https://images.unsplash.com/photo-1454165804606-c3d57bc86b40?ixlib=rb-1.2.1');
-            background-size: cover;
-            background-attachment: fixed;
-            background-position: center;
-            color: #fff;
-            min-height: 100vh;
-        }
-
-        .container {
-            display: flex;
-            min-height: 100vh;
-        }
-
-        .sidebar {
-            width: 250px;
-            background: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(10px);
-            padding: 100px 0 20px 0;
-            border-right: 1px solid rgba(255, 255, 255, 0.1);
-            animation: slideInLeft 0.5s ease-out;
-        }
-
-        .sidebar-logo {
-            padding: 0 20px 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            margin-bottom: 30px;
-            text-align: center;
-        }
-
-        .sidebar-logo img {
-            max-width: 150px;
-            filter: drop-shadow(0 0 10px rgba(0, 212, 255, 0.5));
-        }
-
-        .sidebar-menu {
-            list-style: none;
-            padding: 0;
-            margin: 0;
-        }
-
-        .sidebar-menu li {
-            padding: 12px 25px;
-            margin: 5px 15px;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            transition: all 0.3s;
-            border-radius: 25px;
-            background: rgba(255, 255, 255, 0.1);
-        }
-
-        .sidebar-menu li:hover, .sidebar-menu li.active {
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.2), rgba(0, 255, 157, 0.2));
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        .sidebar-menu li.active {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-        }
-
-        .sidebar-menu li i {
-            margin-right: 10px;
-            width: 20px;
-            text-align: center;
-        }
-
-        .main-content {
-            flex: 1;
-            padding: 100px 20px 20px;
-            background: rgba(0, 0, 0, 0.4);
-            backdrop-filter: blur(5px);
-            animation: fadeIn 0.8s ease-out;
-        }
-
-        .header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 30px;
-            padding-bottom: 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            animation: fadeIn 1s ease-out;
-        }
-
-        .search-bar {
-            flex: 1;
-            max-width: 500px;
-            position: relative;
-        }
-
-        .search-bar input {
-            width: 100%;
-            padding: 12px 20px;
-            border-radius: 30px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            font-size: 14px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #fff;
-            transition: all 0.3s;
-        }
-
-        .search-bar input:focus {
-            outline: none;
-            background: rgba(255, 255, 255, 0.2);
-            box-shadow: 0 0 15px rgba(0, 212, 255, 0.3);
-        }
-
-        .search-bar input::placeholder {
-            color: rgba(255, 255, 255, 0.6);
-        }
-
-        .user-profile {
-            display: flex;
-            align-items: center;
-        }
-
-        .user-profile img {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            margin-right: 15px;
-            border: 2px solid #00d4ff;
-            box-shadow: 0 0 10px rgba(0, 212, 255, 0.5);
-        }
-
-        .job-filters {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-bottom: 30px;
-            animation: fadeIn 1.2s ease-out;
-        }
-
-        .filter-pill {
-            padding: 10px 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 25px;
-            font-size: 14px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-
-        .filter-pill:hover, .filter-pill.active {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border-color: transparent;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        .job-list {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-
-        .job-card {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-            display: flex;
-            transition: all 0.3s;
-            animation: fadeIn 0.5s ease-out forwards;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .job-card:hover {
-            transform: translateY(-5px);
-            background: rgba(255, 255, 255, 0.15);
-            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.2);
-            border-color: rgba(255, 255, 255, 0.3);
-        }
-
-        .job-logo {
-            width: 70px;
-            height: 70px;
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.2), rgba(0, 255, 157, 0.2));
-            border-radius: 12px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-right: 25px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            animation: pulse 4s infinite;
-        }
-
-        .job-logo img {
-            max-width: 45px;
-            max-height: 45px;
-            filter: brightness(0) invert(1);
-        }
-
-        .job-info {
-            flex: 1;
-        }
-
-        .job-title {
-            font-size: 20px;
-            font-weight: 600;
-            margin-bottom: 8px;
-            color: #fff;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }
-
-        .job-company {
-            font-size: 15px;
-            color: rgba(255, 255, 255, 0.8);
-            margin-bottom: 15px;
-        }
-
-        .job-details {
-            display: flex;
-            gap: 20px;
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.7);
-            margin-bottom: 20px;
-        }
-
-        .job-details span {
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-
-        .job-actions {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .match-indicator {
-            display: flex;
-            align-items: center;
-        }
-
-        .match-percentage {
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            color: white;
-            margin-right: 15px;
-            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.5);
-        }
-
-        .high-match {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            box-shadow: 0 0 15px rgba(0, 212, 255, 0.5);
-        }
-
-        .medium-match {
-            background: linear-gradient(45deg, #ffd166, #ff9f1c);
-            box-shadow: 0 0 15px rgba(255, 209, 102, 0.5);
-        }
-
-        .low-match {
-            background: linear-gradient(45deg, #ff6b6b, #ff8e8e);
-            box-shadow: 0 0 15px rgba(255, 107, 107, 0.5);
-        }
-
-        .match-text {
-            font-size: 14px;
-            font-weight: 600;
-        }
-
-        .apply-btn {
-            padding: 10px 25px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-weight: 600;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .apply-btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .apply-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.2);
-        }
-
-        .resume-upload {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 25px;
-            margin-bottom: 30px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            animation: fadeIn 0.8s ease-out;
-        }
-
-        .resume-upload h2 {
-            margin-top: 0;
-            margin-bottom: 20px;
-            font-size: 22px;
-            color: #fff;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }
-
-        .upload-btn {
-            display: inline-block;
-            padding: 12px 25px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-weight: 600;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .upload-btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .upload-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.2);
-        }
-
-        .file-input {
-            display: none;
-        }
-
-        .resume-status {
-            margin-top: 20px;
-            padding: 15px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            font-size: 14px;
-        }
-
-        .skills-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 15px;
-        }
-
-        .skill-tag {
-            padding: 6px 12px;
-            background: rgba(0, 212, 255, 0.2);
-            color: #fff;
-            border-radius: 20px;
-            font-size: 13px;
-            border: 1px solid rgba(0, 212, 255, 0.3);
-            transition: all 0.3s;
-        }
-
-        .skill-tag:hover {
-            background: rgba(0, 212, 255, 0.4);
-            transform: translateY(-2px);
-        }
-
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(8px);
-            animation: fadeIn 0.3s ease-out;
-        }
-
-        .modal-content {
-            background: rgba(10, 10, 10, 0.9);
-            margin: 5% auto;
-            padding: 30px;
-            border-radius: 20px;
-            width: 70%;
-            max-width: 800px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            box-shadow: 0 15px 30px rgba(0, 0, 0, 0.3);
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .close-btn {
-            color: rgba(255, 255, 255, 0.6);
-            float: right;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-
-        .close-btn:hover {
-            color: #fff;
-            text-shadow: 0 0 10px rgba(255, 255, 255, 0.5);
-        }
-
-        .job-detail-header {
-            display: flex;
-            align-items: center;
-            margin-bottom: 30px;
-        }
-
-        .job-detail-logo {
-            width: 90px;
-            height: 90px;
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.2), rgba(0, 255, 157, 0.2));
-            border-radius: 15px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-right: 25px;
-            animation: pulse 4s infinite;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-
-        .job-detail-logo img {
-            max-width: 60px;
-            max-height: 60px;
-            filter: brightness(0) invert(1);
-        }
-
-        .job-detail-info h2 {
-            margin: 0 0 10px 0;
-            font-size: 26px;
-            color: #fff;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }
-
-        .job-detail-company {
-            font-size: 16px;
-            color: rgba(255, 255, 255, 0.8);
-        }
-
-        .job-detail-section {
-            margin-bottom: 30px;
-        }
-
-        .job-detail-section h3 {
-            margin-top: 0;
-            font-size: 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            padding-bottom: 12px;
-            color: #fff;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }
-
-        .job-detail-section p {
-            color: rgba(255, 255, 255, 0.8);
-            line-height: 1.6;
-        }
-
-        .apply-section {
-            text-align: center;
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .apply-section button {
-            padding: 12px 35px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border: none;
-            border-radius: 30px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .apply-section button::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .apply-section button:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.3);
-        }
-
-        .title-highlight {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: bold;
-            display: inline-block;
-        }
-
-        @media (max-width: 768px) {
-            .container {
-                flex-direction: column;
-            }
-            
-            .sidebar {
-                width: 100%;
-                padding: 80px 0 20px;
-            }
-            
-            .main-content {
-                padding-top: 20px;
-            }
-            
-            .job-card {
-                flex-direction: column;
-            }
-            
-            .job-logo {
-                margin-bottom: 20px;
-                margin-right: 0;
-            }
-            
-            .modal-content {
-                width: 90%;
-                margin-top: 10%;
-            }
-            
-            .job-detail-header {
-                flex-direction: column;
-                text-align: center;
-            }
-            
-            .job-detail-logo {
-                margin-right: 0;
-                margin-bottom: 20px;
-            }
-            
-            .header {
-                flex-direction: column;
-                gap: 15px;
-            }
-            
-            .search-bar {
-                max-width: 100%;
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="{{ asset_url('css/job_seeker_dashboard.css') }}">
 </head>
 <body>
     <div class="container">
@@ -1429,988 +2287,159 @@ job_seeker_dashboard = """
                 <li><a href="/logout" style="text-decoration: none; color: inherit;"><i class="fas fa-sign-out-alt"></i> Logout</a></li>
             </ul>
         </div>
-        
-        <div class="main-content">
-            <div class="header">
-                <div class="search-bar">
-                    <input type="text" placeholder="Search for jobs...">
-                </div>
-                <div class="user-profile">
-                    <img src="https://via.placeholder.com/40" alt="User">
-                    <span>{{ username }}</span>
-                </div>
-            </div>
-            
-            <div id="jobs-section">
-                <div class="job-filters">
-                    <div class="filter-pill active">All Jobs</div>
-                    <div class="filter-pill">Remote</div>
-                    <div class="filter-pill">Full-time</div>
-                    <div class="filter-pill">Entry Level</div>
-                </div>
-                
-                <div class="job-list">
-                    {% for job in jobs %}
-                    <div class="job-card" data-job-id="{{ job.id }}">
-                        <div class="job-logo">
-                            <img src="https://via.placeholder.com/40" alt="{{ job.company_name }}">
-                        </div>
-                        <div class="job-info">
-                            <div class="job-title">{{ job.role_name }}</div>
-                            <div class="job-company">{{ job.company_name }}</div>
-                            <div class="job-details">
-                                <span><i class="fas fa-map-marker-alt"></i> {{ job.location|default('Not specified') }}</span>
-                                <span><i class="fas fa-briefcase"></i> {{ job.experience }}</span>
-                            </div>
-                        </div>
-                        <div class="job-actions">
-                            <div class="match-indicator">
-                                {% set match_class = 'high-match' if job.match_percentage >= 70 else ('medium-match' if job.match_percentage >= 40 else 'low-match') %}
-                                <div class="match-percentage {{ match_class }}">{{ job.match_percentage }}%</div>
-                                <div class="match-text">{{ 'Good Match' if job.match_percentage >= 70 else ('Fair Match' if job.match_percentage >= 40 else 'Low Match') }}</div>
-                            </div>
-                            <button class="apply-btn" data-job-id="{{ job.id }}">Apply Now</button>
-                        </div>
-                    </div>
-                    {% endfor %}
-                </div>
-            </div>
-            
-            <div id="resume-section" style="display: none;">
-                <div class="resume-upload">
-                    <h2>Upload Your Resume</h2>
-                    <form action="/upload_resume" method="POST" enctype="multipart/form-data">
-                        <label for="resume-file" class="upload-btn">Choose File</label>
-                        <input type="file" id="resume-file" name="resume" class="file-input" accept=".pdf,.doc,.docx">
-                        <span id="file-name">No file chosen</span>
-                        <button type="submit" class="upload-btn" style="margin-left: 10px;">Upload</button>
-                    </form>
-                    
-                    {% if has_resume %}
-                    <div class="resume-status">
-                        <h3>Resume Analysis</h3>
-                        <p><strong>Skills:</strong></p>
-                        <div class="skills-container">
-                            {% for skill in skills %}
-                            <div class="skill-tag">{{ skill }}</div>
-                            {% endfor %}
-                        </div>
-                        <p><strong>Education:</strong> {{ education|join(', ') }}</p>
-                        <p><strong>Experience:</strong> {{ experience }}</p>
-                    </div>
-                    {% endif %}
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div id="job-detail-modal" class="modal">
-        <div class="modal-content">
-            <span class="close-btn">&times;</span>
-            <div class="job-detail-header">
-                <div class="job-detail-logo">
-                    <img src="https://via.placeholder.com/60" alt="Company Logo">
-                </div>
-                <div class="job-detail-info">
-                    <h2 id="modal-job-title"></h2>
-                    <div id="modal-job-company" class="job-detail-company"></div>
-                </div>
-            </div>
-            
-            <div class="job-detail-section">
-                <h3>Job Description</h3>
-                <p id="modal-job-description"></p>
-            </div>
-            
-            <div class="job-detail-section">
-                <h3>Qualifications</h3>
-                <p id="modal-job-qualifications"></p>
-            </div>
-            
-            <div class="job-detail-section">
-                <h3>Experience Required</h3>
-                <p id="modal-job-experience"></p>
-            </div>
-            
-            <div class="job-detail-section">
-                <h3>Match Analysis</h3>
-                <div id="modal-match-details"></div>
-            </div>
-            
-            <div class="apply-section">
-                <button id="modal-apply-btn">Apply for this Position</button>
-            </div>
-        </div>
-    </div>
-    
-    <script src="https://kit.fontawesome.com/a076d05399.js" crossorigin="anonymous"></script>
-    <script>
-        // Toggle between jobs and resume sections
-        document.getElementById('resume-menu-item').addEventListener('click', function() {
-            document.getElementById('jobs-section').style.display = 'none';
-            document.getElementById('resume-section').style.display = 'block';
-            
-            // Update active menu item
-            document.querySelector('.sidebar-menu li.active').classList.remove('active');
-            this.classList.add('active');
-        });
-        
-        // Show file name when selected
-        document.getElementById('resume-file').addEventListener('change', function() {
-            const fileName = this.files[0] ? this.files[0].name : 'No file chosen';
-            document.getElementById('file-name').textContent = fileName;
-        });
-        
-        // Job detail modal functionality
-        const modal = document.getElementById('job-detail-modal');
-        const closeBtn = document.querySelector('.close-btn');
-        
-        // Close modal when clicking the X
-        closeBtn.addEventListener('click', function() {
-            modal.style.display = 'none';
-        });
-        
-        // Close modal when clicking outside
-        window.addEventListener('click', function(event) {
-            if (event.target === modal) {
-                modal.style.display = 'none';
-            }
-        });
-        
-        // Open modal when clicking on job card
-        document.querySelectorAll('.job-card').forEach(card => {
-            card.addEventListener('click', function(e) {
-                // Don't open modal if clicking apply button
-                if (e.target.classList.contains('apply-btn')) return;
-                
-                const jobId = this.getAttribute('data-job-id');
-                fetchJobDetails(jobId);
-            });
-        });
-        
-        // Apply button functionality
-        document.querySelectorAll('.apply-btn').forEach(btn => {
-            btn.addEventListener('click', function(e) {
-                e.stopPropagation(); // Prevent opening the modal
-                const jobId = this.getAttribute('data-job-id');
-                applyForJob(jobId);
-            });
-        });
-        
-        // Modal apply button
-        document.getElementById('modal-apply-btn').addEventListener('click', function() {
-            const jobId = this.getAttribute('data-job-id');
-            applyForJob(jobId);
-        });
-        
-        // Fetch job details for modal
-        function fetchJobDetails(jobId) {
-            fetch(`/job_details/${jobId}`)
-                .then(response => response.json())
-                .then(data => {
-                    document.getElementById('modal-job-title').textContent = data.role_name;
-                    document.getElementById('modal-job-company').textContent = data.company_name;
-                    document.getElementById('modal-job-description').textContent = data.description;
-                    document.getElementById('modal-job-qualifications').textContent = data.qualifications;
-                    document.getElementById('modal-job-experience').textContent = data.experience;
-                    
-                    // Match details
-                    const matchHtml = `
-                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                            <div class="match-percentage ${data.match_percentage >= 70 ? 'high-match' : (data.match_percentage >= 40 ? 'medium-match' : 'low-match')}" style="margin-right: 15px;">
-                                ${data.match_percentage}%
-                            </div>
-                            <div>
-                                <div style="font-weight: bold; margin-bottom: 5px;">
-                                    ${data.match_percentage >= 70 ? 'Good Match' : (data.match_percentage >= 40 ? 'Fair Match' : 'Low Match')}
-                                </div>
-                                <div>Based on your resume and the job requirements</div>
-                            </div>
-                        </div>
-                        <div>
-                            <p>Your resume matches ${data.match_percentage}% of the job requirements. ${
-                                data.match_percentage >= 70 ? 
-                                'You have a strong profile for this position!' : 
-                                (data.match_percentage >= 40 ? 
-                                'You meet some of the key requirements for this role.' : 
-                                'You might need additional skills or experience for this role.')
-                            }</p>
-                        </div>
-                    `;
-                    document.getElementById('modal-match-details').innerHTML = matchHtml;
-                    
-                    // Set job ID for apply button
-                    document.getElementById('modal-apply-btn').setAttribute('data-job-id', jobId);
-                    
-                    // Show modal
-                    modal.style.display = 'block';
-                })
-                .catch(error => console.error('Error fetching job details:', error));
-        }
-        
-        // Apply for job
-        function applyForJob(jobId) {
-            fetch(`/apply_job/${jobId}`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                }
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    alert('Application submitted successfully!');
-                    // Update button to show applied
-                    const applyBtns = document.querySelectorAll(`.apply-btn[data-job-id="${jobId}"]`);
-                    applyBtns.forEach(btn => {
-                        btn.textContent = 'Applied';
-                        btn.disabled = true;
-                        btn.style.backgroundColor = '#4CAF50';
-                    });
-                    
-                    // Close modal if open
-                    modal.style.display = 'none';
-                } else {
-                    alert(data.message || 'Failed to submit application. Please try again.');
-                }
-            })
-            .catch(error => {
-                console.error('Error applying for job:', error);
-                alert('An error occurred. Please try again.');
-            });
-        }
-    </script>
-</body>
-</html>
-"""
-
-# Continue the recruiter_dashboard template
-
-recruiter_dashboard = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Recruiter Dashboard - CareerSync AI</title>
-    <style>
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes float {
-            0% { transform: translateY(0px); }
-            50% { transform: translateY(-20px); }
-            100% { transform: translateY(0px); }
-        }
-
-        @keyframes shine {
-            0% { background-position: -200% center; }
-            100% { background-position: 200% center; }
-        }
-
-        @keyframes slideInLeft {
-            from { transform: translateX(-100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes slideInRight {
-            from { transform: translateX(100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: 
-                linear-gradient(120deg, rgba(0,0,0,0.8), rgba(0,0,0,0.5)),
-                url('https://images.unsplash.com/photo-1454165804606-c3d57bc86b40?ixlib=rb-1.2.1');
-            background-size: cover;
-            background-attachment: fixed;
-            background-position: center;
-            color: #fff;
-            min-height: 100vh;
-        }
-
-        .container {
-            display: flex;
-            min-height: 100vh;
-        }
-
-        /* Sidebar Styling */
-        .sidebar {
-            width: 250px;
-            background: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(10px);
-            padding: 20px 0;
-            border-right: 1px solid rgba(255, 255, 255, 0.1);
-            animation: slideInLeft 0.5s ease-out;
-        }
-
-        .sidebar-logo {
-            padding: 0 20px 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            margin-bottom: 20px;
-            animation: fadeIn 0.8s ease-out;
-        }
-
-        .sidebar-logo img {
-            max-width: 150px;
-        }
-
-        .sidebar-menu {
-            list-style: none;
-            padding: 0;
-            margin: 0;
-        }
-
-        .sidebar-menu li {
-            padding: 10px 20px;
-            margin: 5px 10px;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            transition: all 0.3s;
-            border-radius: 15px;
-            background: rgba(255, 255, 255, 0.1);
-            animation: fadeIn 0.5s ease-out forwards;
-        }
-
-        .sidebar-menu li:hover, .sidebar-menu li.active {
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.2), rgba(0, 255, 157, 0.2));
-            color: #fff;
-            transform: translateX(5px);
-        }
-
-        .sidebar-menu li.active {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-        }
-
-        .sidebar-menu li i {
-            margin-right: 10px;
-            width: 20px;
-            text-align: center;
-        }
-
-        /* Main Content Styling */
-        .main-content {
-            flex: 1;
-            padding: 20px;
-            background: rgba(0, 0, 0, 0.4);
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 30px;
-            padding-bottom: 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .page-title {
-            font-size: 24px;
-            font-weight: 600;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            animation: float 6s ease-in-out infinite;
-        }
-
-        .user-profile {
-            display: flex;
-            align-items: center;
-            background: rgba(255, 255, 255, 0.1);
-            padding: 8px 15px;
-            border-radius: 30px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            transition: all 0.3s ease;
-        }
-
-        .user-profile:hover {
-            background: rgba(255, 255, 255, 0.2);
-            transform: translateY(-2px);
-        }
-
-        .user-profile img {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            margin-right: 10px;
-            border: 2px solid rgba(0, 212, 255, 0.7);
-        }
-
-        /* Dashboard Stats */
-        .dashboard-stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-            animation: fadeIn 0.8s ease-out;
-        }
-
-        .stat-card {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            display: flex;
-            flex-direction: column;
-            transition: all 0.3s;
-            animation: fadeIn 0.5s ease-out forwards;
-        }
-
-        .stat-card:hover {
-            transform: translateY(-5px);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(255, 255, 255, 0.3);
-        }
-
-        .stat-value {
-            font-size: 28px;
-            font-weight: 700;
-            margin-bottom: 5px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-
-        .stat-label {
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 14px;
-        }
-
-        /* Tabs Styling */
-        .content-tabs {
-            display: flex;
-            margin-bottom: 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .tab {
-            padding: 10px 20px;
-            cursor: pointer;
-            transition: all 0.3s;
-            border-radius: 10px 10px 0 0;
-            margin-right: 5px;
-            color: rgba(255, 255, 255, 0.7);
-        }
-
-        .tab:hover {
-            background: rgba(255, 255, 255, 0.1);
-            color: #fff;
-        }
-
-        .tab.active {
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.3), rgba(0, 255, 157, 0.3));
-            color: #fff;
-            border-bottom: 2px solid #00d4ff;
-        }
-
-        .tab-content {
-            display: none;
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .tab-content.active {
-            display: block;
-        }
-
-        /* Section Headers */
-        .section-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }
-
-        .section-title {
-            font-size: 18px;
-            font-weight: 600;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-
-        .action-btn {
-            padding: 10px 20px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            text-decoration: none;
-            display: inline-block;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .action-btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .action-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        /* Job Lists */
-        .job-list, .applicant-list {
-            display: flex;
-            flex-direction: column;
-            gap: 15px;
-        }
-
-        .job-card {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(5px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            display: flex;
-            justify-content: space-between;
-            transition: all 0.3s;
-            animation: fadeIn 0.5s ease-out forwards;
-        }
-
-        .job-card:hover {
-            transform: translateY(-3px);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(255, 255, 255, 0.3);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);
-        }
-
-        .job-info {
-            flex: 1;
-        }
-
-        .job-title {
-            font-size: 18px;
-            font-weight: 600;
-            margin-bottom: 5px;
-            color: #fff;
-        }
-
-        .job-company {
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.7);
-            margin-bottom: 10px;
-        }
-
-        .job-meta {
-            display: flex;
-            gap: 15px;
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.6);
-        }
-
-        .job-actions {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-
-        /* Applicant Cards */
-        .applicant-card {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(5px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: all 0.3s;
-            animation: fadeIn 0.5s ease-out forwards;
-        }
-
-        .applicant-card:hover {
-            transform: translateY(-3px);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(255, 255, 255, 0.3);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);
-        }
-
-        .applicant-info {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .applicant-avatar {
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.3), rgba(0, 255, 157, 0.3));
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            color: #fff;
-            border: 2px solid rgba(0, 212, 255, 0.7);
-        }
-
-        .applicant-details h3 {
-            margin: 0 0 5px 0;
-            font-size: 16px;
-        }
-
-        .applicant-details p {
-            margin: 0;
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.7);
-        }
-
-        /* Status Badges */
-        .match-badge {
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 14px;
-            font-weight: 600;
-            color: white;
-            animation: pulse 2s infinite;
-        }
-
-        .high-match {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-        }
-
-        .medium-match {
-            background: linear-gradient(45deg, #ffd166, #ff9f1c);
-        }
-
-        .low-match {
-            background: linear-gradient(45deg, #ff6b6b, #ff8e8e);
-        }
-
-        .status-badge {
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-
-        .status-pending {
-            background: rgba(0, 112, 243, 0.2);
-            color: #00d4ff;
-        }
-
-        .status-approved {
-            background: rgba(40, 167, 69, 0.2);
-            color: #00ff9d;
-        }
-
-        .status-rejected {
-            background: rgba(220, 53, 69, 0.2);
-            color: #ff6b6b;
-        }
-
-        /* Modal Styling */
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0, 0, 0, 0.7);
-            animation: fadeIn 0.3s ease-out;
-        }
-
-        .modal-content {
-            background: rgba(0, 0, 0, 0.8);
-            backdrop-filter: blur(15px);
-            margin: 10% auto;
-            padding: 30px;
-            border-radius: 15px;
-            width: 60%;
-            max-width: 700px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .close-btn {
-            color: rgba(255, 255, 255, 0.7);
-            float: right;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-
-        .close-btn:hover {
-            color: #fff;
-            transform: rotate(90deg);
-        }
-
-        /* Form Styling */
-        .form-group {
-            margin-bottom: 20px;
-        }
-
-        .form-group label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: rgba(255, 255, 255, 0.9);
-        }
-
-        .form-group input, .form-group textarea {
-            width: 100%;
-            padding: 12px;
-            background: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 10px;
-            color: #fff;
-            font-size: 14px;
-            transition: all 0.3s;
-        }
-
-        .form-group input:focus, .form-group textarea:focus {
-            outline: none;
-            border-color: rgba(0, 212, 255, 0.7);
-            background: rgba(255, 255, 255, 0.15);
-        }
-
-        .form-group textarea {
-            min-height: 100px;
-            resize: vertical;
-        }
-
-        .submit-btn {
-            padding: 12px 25px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-weight: bold;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .submit-btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .submit-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        /* Applicant Detail */
-        .applicant-detail-header {
-            display: flex;
-            align-items: center;
-            margin-bottom: 30px;
-            animation: fadeIn 0.5s ease-out;
-        }
-
-        .applicant-detail-avatar {
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            background: linear-gradient(45deg, rgba(0, 212, 255, 0.3), rgba(0, 255, 157, 0.3));
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            font-size: 24px;
-            color: #fff;
-            margin-right: 20px;
-            border: 2px solid rgba(0, 212, 255, 0.7);
-            animation: pulse 3s infinite;
-        }
-
-        .applicant-detail-info h2 {
-            margin: 0 0 5px 0;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-
-        .applicant-detail-job {
-            font-size: 16px;
-            color: rgba(255, 255, 255, 0.7);
-        }
-
-        .applicant-detail-section {
-            margin-bottom: 30px;
-            animation: fadeIn 0.8s ease-out;
-        }
-
-        .applicant-detail-section h3 {
-            margin-top: 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            padding-bottom: 10px;
-            color: rgba(255, 255, 255, 0.9);
-        }
-
-        .skills-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 10px;
-        }
-
-        .skill-tag {
-            padding: 8px 12px;
-            background: rgba(0, 212, 255, 0.2);
-            color: #00d4ff;
-            border-radius: 15px;
-            font-size: 12px;
-            transition: all 0.3s;
-            border: 1px solid rgba(0, 212, 255, 0.3);
-        }
-
-        .skill-tag:hover {
-            transform: translateY(-2px);
-            background: rgba(0, 212, 255, 0.3);
-        }
-
-        .action-buttons {
-            display: flex;
-            gap: 15px;
-            margin-top: 30px;
-        }
-
-        .approve-btn {
-            padding: 12px 25px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-weight: bold;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .approve-btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .approve-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
+        
+        <div class="main-content">
+            <div class="header">
+                <div class="search-bar">
+                    <input type="text" placeholder="Search for jobs...">
+                </div>
+                <div class="user-profile">
+                    <img src="https://via.placeholder.com/40" alt="User">
+                    <span>{{ username }}</span>
+                </div>
+            </div>
+            
+            {% for message in get_flashed_messages() %}
+            <div class="flash-message">{{ message }}</div>
+            {% endfor %}
 
-        .reject-btn {
-            padding: 12px 25px;
-            background: rgba(220, 53, 69, 0.3);
-            color: white;
-            border: 1px solid rgba(220, 53, 69, 0.5);
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-weight: bold;
-        }
+            {% if resume_job %}
+            <div class="resume-job-status" data-job-id="{{ resume_job.id }}" data-status="{{ resume_job.status }}">
+                {% if resume_job.status == 'failed' %}
+                Your resume could not be processed: {{ resume_job.error }}
+                {% else %}
+                Your resume is being analyzed. Your matches will appear here when it is ready.
+                {% endif %}
+            </div>
+            {% endif %}
 
-        .reject-btn:hover {
-            transform: translateY(-3px);
-            background: rgba(220, 53, 69, 0.5);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
+            <div id="jobs-section">
+                <div class="job-filters">
+                    <div class="filter-pill active">All Jobs</div>
+                    <div class="filter-pill">Remote</div>
+                    <div class="filter-pill">Full-time</div>
+                    <div class="filter-pill">Entry Level</div>
+                </div>
+                
+                <div class="job-list">
+                    {% for job in jobs %}
+                    <div class="job-card" data-job-id="{{ job.id }}">
+                        <div class="job-logo">
+                            <img src="https://via.placeholder.com/40" alt="{{ job.company_name }}">
+                        </div>
+                        <div class="job-info">
+                            <div class="job-title">{{ job.role_name }}</div>
+                            <div class="job-company">{{ job.company_name }}</div>
+                            <div class="job-details">
+                                <span><i class="fas fa-map-marker-alt"></i> {{ job.location|default('Not specified') }}</span>
+                                <span><i class="fas fa-briefcase"></i> {{ job.experience }}</span>
+                            </div>
+                        </div>
+                        <div class="job-actions">
+                            <div class="match-indicator">
+                                {% set match_class = 'high-match' if job.match_percentage >= 70 else ('medium-match' if job.match_percentage >= 40 else 'low-match') %}
+                                <div class="match-percentage {{ match_class }}">{{ job.match_percentage }}%</div>
+                                <div class="match-text">{{ 'Good Match' if job.match_percentage >= 70 else ('Fair Match' if job.match_percentage >= 40 else 'Low Match') }}</div>
+                            </div>
+                            <button class="apply-btn" data-job-id="{{ job.id }}">Apply Now</button>
+                        </div>
+                    </div>
+                    {% endfor %}
+                </div>
 
-        /* Responsive Styling */
-        @media (max-width: 768px) {
-            .container {
-                flex-direction: column;
-            }
-            
-            .sidebar {
-                width: 100%;
-                padding: 10px 0;
-            }
-            
-            .dashboard-stats {
-                grid-template-columns: 1fr;
-            }
+                <div class="pagination">
+                    {% if request.args.get('after') %}
+                    <a href="/dashboard" class="filter-pill">First page</a>
+                    {% endif %}
+                    {% if next_cursor %}
+                    <a href="/dashboard?after={{ next_cursor|urlencode }}" class="filter-pill">Next page</a>
+                    {% endif %}
+                </div>
+            </div>
             
-            .job-card, .applicant-card {
-                flex-direction: column;
-            }
+            <div id="resume-section" style="display: none;">
+                <div class="resume-upload">
+                    <h2>Upload Your Resume</h2>
+                    <form action="/upload_resume" method="POST" enctype="multipart/form-data">
+                        <label for="resume-file" class="upload-btn">Choose File</label>
+                        <input type="file" id="resume-file" name="resume" class="file-input" accept=".pdf,.doc,.docx,.rtf,.txt">
+                        <span id="file-name">No file chosen</span>
+                        <button type="submit" class="upload-btn" style="margin-left: 10px;">Upload</button>
+                    </form>
+                    
+                    {% if has_resume %}
+                    <div class="resume-status">
+                        <h3>Resume Analysis</h3>
+                        <p><strong>Skills:</strong></p>
+                        <div class="skills-container">
+                            {% for skill in skills %}
+                            <div class="skill-tag">{{ skill }}</div>
+                            {% endfor %}
+                        </div>
+                        <p><strong>Education:</strong> {{ education|join(', ') }}</p>
+                        <p><strong>Experience:</strong> {{ experience }}</p>
+                    </div>
+                    {% endif %}
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div id="job-detail-modal" class="modal">
+        <div class="modal-content">
+            <span class="close-btn">&times;</span>
+            <div class="job-detail-header">
+                <div class="job-detail-logo">
+                    <img src="https://via.placeholder.com/60" alt="Company Logo">
+                </div>
+                <div class="job-detail-info">
+                    <h2 id="modal-job-title"></h2>
+                    <div id="modal-job-company" class="job-detail-company"></div>
+                </div>
+            </div>
             
-            .job-actions, .applicant-actions {
-                margin-top: 15px;
-            }
+            <div class="job-detail-section">
+                <h3>Job Description</h3>
+                <p id="modal-job-description"></p>
+            </div>
             
-            .modal-content {
-                width: 90%;
-            }
+            <div class="job-detail-section">
+                <h3>Qualifications</h3>
+                <p id="modal-job-qualifications"></p>
+            </div>
             
-            .hero h1 {
-                font-size: 2.5rem;
-            }
+            <div class="job-detail-section">
+                <h3>Experience Required</h3>
+                <p id="modal-job-experience"></p>
+            </div>
             
-            .section {
-                margin: 10px;
-                padding: 20px 15px;
-            }
+            <div class="job-detail-section">
+                <h3>Match Analysis</h3>
+                <div id="modal-match-details"></div>
+            </div>
             
-            .action-btn, .submit-btn, .approve-btn, .reject-btn {
-                padding: 10px 20px;
-            }
-        }
-    </style>
+            <div class="apply-section">
+                <button id="modal-apply-btn">Apply for this Position</button>
+            </div>
+        </div>
+    </div>
+    
+    <script src="https://kit.fontawesome.com/a076d05399.js" crossorigin="anonymous"></script>
+    <script src="{{ asset_url('js/job_seeker_dashboard.js') }}"></script>
+</body>
+</html>
+"""
+
+# Continue the recruiter_dashboard template
+
+recruiter_dashboard = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Recruiter Dashboard - CareerSync AI</title>
+    <link rel="stylesheet" href="{{ asset_url('css/recruiter_dashboard.css') }}">
 </head>
 <body>
     <div class="container">
@@ -2563,6 +2592,15 @@ recruiter_dashboard = """
                     </div>
                     {% endfor %}
                 </div>
+
+                <div class="pagination">
+                    {% if request.args.get('applicants_before') %}
+                    <a href="/dashboard#applicants" class="action-btn">First page</a>
+                    {% endif %}
+                    {% if next_cursor %}
+                    <a href="/dashboard?applicants_before={{ next_cursor|urlencode }}#applicants" class="action-btn">Next page</a>
+                    {% endif %}
+                </div>
             </div>
             
             <!-- Analytics Tab -->
@@ -2656,180 +2694,7 @@ recruiter_dashboard = """
     </div>
     
     <script src="https://kit.fontawesome.com/a076d05399.js" crossorigin="anonymous"></script>
-    <script>
-        // Tab switching functionality
-        document.querySelectorAll('.sidebar-menu li[data-tab]').forEach(item => {
-            item.addEventListener('click', function() {
-                // Update active tab in sidebar
-                document.querySelector('.sidebar-menu li.active').classList.remove('active');
-                this.classList.add('active');
-                
-                // Show corresponding tab content
-                const tabId = this.getAttribute('data-tab');
-                document.querySelectorAll('.tab-content').forEach(tab => {
-                    tab.classList.remove('active');
-                });
-                document.getElementById(tabId + '-tab').classList.add('active');
-            });
-        });
-        
-        // Modal functionality
-        const postJobModal = document.getElementById('post-job-modal');
-        const applicantDetailModal = document.getElementById('applicant-detail-modal');
-        const closeBtns = document.querySelectorAll('.close-btn');
-        
-        // Open post job modal
-        document.getElementById('post-job-btn').addEventListener('click', function() {
-            postJobModal.style.display = 'block';
-        });
-        
-        document.getElementById('post-job-btn-2').addEventListener('click', function() {
-            postJobModal.style.display = 'block';
-        });
-        
-        // Close modals when clicking the X
-        closeBtns.forEach(btn => {
-            btn.addEventListener('click', function() {
-                postJobModal.style.display = 'none';
-                applicantDetailModal.style.display = 'none';
-            });
-        });
-        
-        // Close modals when clicking outside
-        window.addEventListener('click', function(event) {
-            if (event.target === postJobModal) {
-                postJobModal.style.display = 'none';
-            }
-            if (event.target === applicantDetailModal) {
-                applicantDetailModal.style.display = 'none';
-            }
-        });
-        
-        // View applicant details
-        document.querySelectorAll('.applicant-card, .view-applicant-btn').forEach(item => {
-            item.addEventListener('click', function(e) {
-                // Don't trigger if clicking on a button inside the card
-                if (e.target.classList.contains('action-btn') && !e.target.classList.contains('view-applicant-btn')) return;
-                
-                const applicantId = this.closest('.applicant-card').getAttribute('data-applicant-id');
-                fetchApplicantDetails(applicantId);
-            });
-        });
-        
-        // Fetch applicant details
-        function fetchApplicantDetails(applicantId) {
-            fetch(`/applicant_details/${applicantId}`)
-                .then(response => response.json())
-                .then(data => {
-                    // Set applicant details in modal
-                    document.getElementById('applicant-detail-avatar').textContent = data.username[0];
-                    document.getElementById('applicant-detail-name').textContent = data.username;
-                    document.getElementById('applicant-detail-job').textContent = `Applied for ${data.role_name} at ${data.company_name}`;
-                    
-                    // Match details
-                    const matchClass = data.match_percentage >= 70 ? 'high-match' : (data.match_percentage >= 40 ? 'medium-match' : 'low-match');
-                    const matchHtml = `
-                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                            <div class="match-badge ${matchClass}" style="margin-right: 15px;">
-                                ${data.match_percentage}%
-                            </div>
-                            <div>
-                                <div style="font-weight: bold; margin-bottom: 5px;">
-                                    ${data.match_percentage >= 70 ? 'Good Match' : (data.match_percentage >= 40 ? 'Fair Match' : 'Low Match')}
-                                </div>
-                                <div>Based on job requirements and candidate's resume</div>
-                            </div>
-                        </div>
-                    `;
-                    document.getElementById('applicant-match-details').innerHTML = matchHtml;
-                    
-                    // Skills
-                    const skillsHtml = data.skills.map(skill => `<div class="skill-tag">${skill}</div>`).join('');
-                    document.getElementById('applicant-skills').innerHTML = skillsHtml || 'No skills extracted';
-                    
-                    // Education
-                    document.getElementById('applicant-education').textContent = data.education.join(', ') || 'Not specified';
-                    
-                    // Experience
-                    document.getElementById('applicant-experience').textContent = data.experience;
-                    
-                    // Resume text
-                    document.getElementById('applicant-resume-text').textContent = data.resume_text;
-                    
-                    // Set application ID for approve/reject buttons
-                    document.getElementById('approve-btn').setAttribute('data-application-id', data.id);
-                    document.getElementById('reject-btn').setAttribute('data-application-id', data.id);
-                    
-                    // Update button states based on current status
-                    if (data.status === 'approved') {
-                        document.getElementById('approve-btn').disabled = true;
-                        document.getElementById('approve-btn').textContent = 'Already Approved';
-                        // Continue the recruiter_dashboard JavaScript
-                        document.getElementById('reject-btn').disabled = false;
-                    } else if (data.status === 'rejected') {
-                        document.getElementById('reject-btn').disabled = true;
-                        document.getElementById('reject-btn').textContent = 'Already Rejected';
-                        document.getElementById('approve-btn').disabled = false;
-                    } else {
-                        document.getElementById('approve-btn').disabled = false;
-                        document.getElementById('reject-btn').disabled = false;
-                        document.getElementById('approve-btn').textContent = 'Approve Application';
-                        document.getElementById('reject-btn').textContent = 'Reject Application';
-                    }
-                    
-                    // Show modal
-                    applicantDetailModal.style.display = 'block';
-                })
-                .catch(error => console.error('Error fetching applicant details:', error));
-        }
-        
-        // Approve application
-        document.getElementById('approve-btn').addEventListener('click', function() {
-            const applicationId = this.getAttribute('data-application-id');
-            updateApplicationStatus(applicationId, 'approved');
-        });
-        
-        // Reject application
-        document.getElementById('reject-btn').addEventListener('click', function() {
-            const applicationId = this.getAttribute('data-application-id');
-            updateApplicationStatus(applicationId, 'rejected');
-        });
-        
-        // Update application status
-        function updateApplicationStatus(applicationId, status) {
-            fetch(`/update_application_status/${applicationId}`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ status: status })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    // Close modal
-                    applicantDetailModal.style.display = 'none';
-                    
-                    // Update UI to reflect the new status
-                    const statusClass = status === 'approved' ? 'status-approved' : 'status-rejected';
-                    const statusText = status.charAt(0).toUpperCase() + status.slice(1);
-                    
-                    document.querySelectorAll(`.applicant-card[data-applicant-id="${applicationId}"] .status-badge`).forEach(badge => {
-                        badge.className = `status-badge ${statusClass}`;
-                        badge.textContent = statusText;
-                    });
-                    
-                    alert(`Application ${statusText} successfully!`);
-                } else {
-                    alert('Failed to update application status. Please try again.');
-                }
-            })
-            .catch(error => {
-                console.error('Error updating application status:', error);
-                alert('An error occurred. Please try again.');
-            });
-        }
-    </script>
+    <script src="{{ asset_url('js/recruiter_dashboard.js') }}"></script>
 </body>
 </html>
 """
@@ -3003,43 +2868,7 @@ login_page = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Login - CareerSync AI</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(to right, #1e3c72, #2a5298);
-            color: #fff;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            height: 100vh;
-        }
-        .login-container {
-            background: #fff;
-            color: #000;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-            width: 300px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .login-container input {
-            width: 90%;
-            padding: 10px;
-            margin: 10px 0;
-            border: 1px solid #ccc;
-            border-radius: 5px;
-        }
-        .login-container button {
-            padding: 10px 20px;
-            background: #1e3c72;
-            color: #fff;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ asset_url('css/login.css') }}">
 </head>
 <body>
     <div class="login-container">
@@ -3068,47 +2897,7 @@ register_page = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Register - CareerSync AI</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(to right, #1e3c72, #2a5298);
-            color: #fff;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            height: 100vh;
-        }
-        .register-container {
-            background: #fff;
-            color: #000;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-            width: 300px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .register-container input, .register-container select {
-            width: 90%;
-            padding: 10px;
-            margin: 10px 0;
-            border: 1px solid #ccc;
-            border-radius: 5px;
-        }
-        .register-container button {
-            padding: 10px 20px;
-            background: #1e3c72;
-            color: #fff;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        .login-link {
-            margin-top: 10px;
-            font-size: 0.9em;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ asset_url('css/register.css') }}">
 </head>
 <body>
     <div class="register-container">
@@ -3135,126 +2924,12 @@ register_page = """
 
 dashboard_page = """
 <!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard - CareerSync AI</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: 
-                linear-gradient(120deg, rgba(0,0,0,0.7), rgba(0,0,0,0.4)),
-                url('https://images.unsplash.com/photo-1497215728101-856f4ea42174?ixlib=rb-1.2.1&auto=format&fit=crop&w=1950&q=80');
-            background-size: cover;
-            background-attachment: fixed;
-            background-position: center;
-            color: #fff;
-            min-height: 100vh;
-        }
-        nav {
-            display: flex;
-            justify-content: space-between;
-            padding: 15px 30px;
-            background: rgba(0, 0, 0, 0.8);
-            backdrop-filter: blur(10px);
-        }
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 10px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-            background: rgba(255, 255, 255, 0.1);
-        }
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.2);
-            transform: translateY(-2px);
-        }
-        .container {
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-        }
-        .upload-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .upload-section h2 {
-            margin-bottom: 20px;
-            color: #fff;
-        }
-        .file-upload {
-            display: none;
-        }
-        .upload-btn {
-            display: inline-block;
-            padding: 12px 24px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: #fff;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            margin-bottom: 15px;
-        }
-        .upload-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .submit-btn {
-            padding: 12px 30px;
-            background: #00ff9d;
-            color: #fff;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: all 0.3s ease;
-        }
-        .submit-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .skills-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            margin-top: 30px;
-        }
-        .skills-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        .skill-item {
-            background: rgba(255, 255, 255, 0.2);
-            padding: 10px;
-            border-radius: 10px;
-            text-align: center;
-            transition: all 0.3s ease;
-        }
-        .skill-item:hover {
-            transform: translateY(-3px);
-            background: rgba(255, 255, 255, 0.3);
-        }
-        #selected-file {
-            margin-top: 10px;
-            color: #fff;
-        }
-        .error-message {
-            color: #ff6b6b;
-            margin-top: 10px;
-        }
-    </style>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dashboard - CareerSync AI</title>
+    <link rel="stylesheet" href="{{ asset_url('css/dashboard.css') }}">
 </head>
 <body>
     <nav>
@@ -3267,7 +2942,7 @@ dashboard_page = """
         <div class="upload-section">
             <h2>Upload Your Resume</h2>
             <form action="/upload_resume" method="POST" enctype="multipart/form-data">
-                <input type="file" name="resume" id="resume" class="file-upload" accept=".pdf,.doc,.docx">
+                <input type="file" name="resume" id="resume" class="file-upload" accept=".pdf,.doc,.docx,.rtf,.txt">
                 <label for="resume" class="upload-btn">Choose File</label>
                 <div id="selected-file">No file chosen</div>
                 {% if error %}
@@ -3296,12 +2971,7 @@ dashboard_page = """
         {% endif %}
     </div>
 
-    <script>
-        document.getElementById('resume').addEventListener('change', function(e) {
-            var fileName = e.target.files[0] ? e.target.files[0].name : 'No file chosen';
-            document.getElementById('selected-file').textContent = fileName;
-        });
-    </script>
+    <script src="{{ asset_url('js/dashboard.js') }}"></script>
 </body>
 </html>
 """
@@ -3313,108 +2983,7 @@ post_job_page = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Post a Job </title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(120deg, #ff9a9e, #fad0c4, #fbc2eb, #a18cd1);
-            background-size: 400% 400%;
-            animation: gradientBG 10s ease infinite;
-            min-height: 100vh;
-            color: #fff;
-        }
-
-        @keyframes gradientBG {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .container {
-            max-width: 800px;
-            margin: 80px auto;
-            padding: 30px;
-            background: rgba(0, 0, 0, 0.7);
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-        }
-
-        h1 {
-            text-align: center;
-            margin-bottom: 30px;
-            color: #fff;
-        }
-
-        form {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-
-        .form-group {
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-        }
-
-        label {
-            font-weight: bold;
-            color: #fff;
-        }
-
-        input, textarea {
-            padding: 12px;
-            border: none;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.9);
-            font-size: 16px;
-        }
-
-        textarea {
-            min-height: 120px;
-            resize: vertical;
-        }
-
-        button {
-            padding: 15px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            border: none;
-            border-radius: 8px;
-            color: #fff;
-            font-size: 16px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-
-        button:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-
-        nav {
-            position: fixed;
-            top: 0;
-            width: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            padding: 15px 0;
-            backdrop-filter: blur(10px);
-        }
-
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 15px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-        }
-
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.1);
-        }
-    </style>
+    <link rel="stylesheet" href="{{ asset_url('css/post_job.css') }}">
 </head>
 <body>
     <nav>
@@ -3458,93 +3027,7 @@ view_jobs_page = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>View Jobs </title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(120deg, #ff9a9e, #fad0c4, #fbc2eb, #a18cd1);
-            background-size: 400% 400%;
-            animation: gradientBG 10s ease infinite;
-            min-height: 100vh;
-            color: #fff;
-        }
-
-        @keyframes gradientBG {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 80px auto;
-            padding: 20px;
-        }
-
-        .jobs-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }
-
-        .job-card {
-            background: rgba(0, 0, 0, 0.7);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            transition: transform 0.3s ease;
-        }
-
-        .job-card:hover {
-            transform: translateY(-5px);
-        }
-
-        .job-card h3 {
-            color: #00d4ff;
-            margin-bottom: 10px;
-        }
-
-        .job-card h4 {
-            color: #00ff9d;
-            margin-bottom: 15px;
-        }
-
-        .job-card p {
-            margin: 10px 0;
-            color: #fff;
-        }
-
-        nav {
-            position: fixed;
-            top: 0;
-            width: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            padding: 15px 0;
-            backdrop-filter: blur(10px);
-            z-index: 1000;
-        }
-
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 15px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-        }
-
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.1);
-        }
-
-        h1 {
-            text-align: center;
-            margin-bottom: 30px;
-            color: #fff;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ asset_url('css/view_jobs.css') }}">
 </head>
 <body>
     <nav>
@@ -3564,15 +3047,135 @@ view_jobs_page = """
             </div>
             {% endfor %}
         </div>
+        <div class="pagination">
+            {% if request.args.get('after') %}
+            <a href="/view_jobs">First page</a>
+            {% endif %}
+            {% if next_cursor %}
+            <a href="/view_jobs?after={{ next_cursor|urlencode }}">Next page</a>
+            {% endif %}
+        </div>
     </div>
 </body>
 </html>
 """
 
+# Text responses above the size threshold are compressed with the best coding the client accepts
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 6
+COMPRESS_MIMETYPES = {'text/html', 'text/css', 'text/javascript', 'application/javascript',
+                      'application/json'}
+
+def compress(data, encoding, level=COMPRESS_LEVEL):
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=min(level, 9))
+
+def accepted_encoding():
+    """Preferred content coding from Accept-Encoding, None for identity"""
+    return request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+
+@app.after_request
+def compress_response(response):
+    # Static assets are served from precompressed variants below
+    if (request.endpoint == 'static' or response.direct_passthrough or response.is_streamed
+            or response.status_code != 200 or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding()
+    if encoding is None or response.content_length < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+# Page CSS and JS live in static/ and are linked with a content fingerprint, so a
+# fingerprinted URL never changes meaning and browsers can cache it indefinitely
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
+
+def fingerprint_static_assets(folder):
+    """Content hash of every file under the static folder, keyed by its URL filename"""
+    hashes = {}
+    for root, _, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()[:12]
+            hashes[os.path.relpath(path, folder).replace(os.sep, '/')] = digest
+    return hashes
+
+def precompress_static_assets(folder):
+    """Compressed variants of the compressible static assets, built once at maximum level"""
+    variants = {}
+    for filename in asset_hashes:
+        if mimetypes.guess_type(filename)[0] not in COMPRESS_MIMETYPES:
+            continue
+        with open(os.path.join(folder, filename), 'rb') as f:
+            data = f.read()
+        encoded = {'gzip': compress(data, 'gzip', 9)}
+        if brotli:
+            encoded['br'] = compress(data, 'br', 11)
+        variants[filename] = {encoding: body for encoding, body in encoded.items()
+                              if len(body) < len(data)}
+    return variants
+
+asset_hashes = fingerprint_static_assets(app.static_folder)
+asset_variants = precompress_static_assets(app.static_folder)
+
+@app.template_global()
+def asset_url(filename):
+    """URL of a static asset carrying its content fingerprint"""
+    return url_for('static', filename=filename, v=asset_hashes.get(filename))
+
+@app.after_request
+def cache_static_assets(response):
+    if request.endpoint != 'static':
+        return response
+    filename = request.view_args.get('filename')
+    digest = asset_hashes.get(filename)
+    if digest is None:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding()
+    variant = asset_variants.get(filename, {}).get(encoding)
+    etag = digest
+    if variant is not None and response.status_code == 200:
+        response.direct_passthrough = False
+        response.set_data(variant)
+        response.headers['Content-Encoding'] = encoding
+        # Each encoding is a different representation, so it gets its own ETag
+        etag = f'{digest}-{encoding}'
+    # ETag from the content hash stays stable across restarts and servers
+    response.set_etag(etag)
+    # The fingerprint in asset URLs is the hash of the uncompressed file
+    if request.args.get('v') == digest:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+# Register the page templates once so Jinja compiles each a single time and serves
+# later renders from its template cache instead of recompiling the source per request
+app.jinja_loader = ChoiceLoader([
+    DictLoader({
+        'home.html': home_page,
+        'job_seeker_dashboard.html': job_seeker_dashboard,
+        'recruiter_dashboard.html': recruiter_dashboard,
+        'post_job.html': post_job_page,
+        'login.html': login_page,
+        'register.html': register_page,
+        'dashboard.html': dashboard_page,
+        'view_jobs.html': view_jobs_page,
+    }),
+    app.jinja_loader,
+])
+
 # Routes
 @app.route('/')
 def home():
-    return render_template_string(home_page)
+    return render_template('home.html')
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -3581,38 +3184,32 @@ def register():
         password = request.form['password']
         role = request.form['role']
         
-        conn = sqlite3.connect('database.db')
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('INSERT INTO users (username, password, role) VALUES (?, ?, ?)',
-                         (username, password, role))
-            conn.commit()
-            conn.close()
+            with db_write() as cursor:
+                cursor.execute('INSERT INTO users (username, password, role) VALUES (?, ?, ?)',
+                             (username, password, role))
             return redirect(url_for('login'))
         except sqlite3.IntegrityError:
-            conn.close()
-            return render_template_string(register_page, error="Username already exists")
+            return render_template('register.html', error="Username already exists")
         
-    return render_template_string(register_page)
+    return render_template('register.html')
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM users WHERE username = ? AND password = ?', (username, password))
         user = cursor.fetchone()
-        conn.close()
         if user:
             session['username'] = user[1]
             session['role'] = user[3]
             return redirect(url_for('dashboard'))
         else:
-            return render_template_string(login_page, error="Invalid credentials")
-    return render_template_string(login_page)
+            return render_template('login.html', error="Invalid credentials")
+    return render_template('login.html')
 
 
 
@@ -3634,49 +3231,26 @@ def dashboard():
 
     if role == 'job_seeker':
         # Get user's resume data if exists
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM resumes WHERE user_id = ?', (user_id,))
         resume_data = cursor.fetchone()
 
-        # Get all jobs with match percentage
+        # Get the latest upload if it is still being processed or failed
+        cursor.execute('''
+            SELECT id, status, error FROM resume_jobs WHERE user_id = ? ORDER BY id DESC LIMIT 1
+        ''', (user_id,))
+        latest_job = cursor.fetchone()
+        resume_job = None
+        if latest_job and latest_job[1] != 'done':
+            resume_job = {'id': latest_job[0], 'status': latest_job[1], 'error': latest_job[2]}
+
+        # Get one page of jobs ranked by match percentage
         jobs = []
+        next_cursor = None
         if resume_data:
-            cursor.execute('SELECT * FROM jobs')
-            all_jobs = cursor.fetchall()
-
-            for job in all_jobs:
-                job_id = job[0]
-                company_name = job[1]
-                role_name = job[2]
-                description = job[3]
-                qualifications = job[4]
-                experience = job[5]
-                location = job[6] if len(job) > 6 else "Not specified"
-
-                # Calculate match percentage
-                job_description = f"{role_name} {description} {qualifications} {experience}"
-                match_percentage = calculate_match_percentage(resume_data[2], job_description)
-
-                # Check if user has already applied
-                cursor.execute('SELECT * FROM applications WHERE job_id = ? AND user_id = ?',
-                              (job_id, user_id))
-                application = cursor.fetchone()
-
-                jobs.append({
-                    'id': job_id,
-                    'company_name': company_name,
-                    'role_name': role_name,
-                    'description': description,
-                    'qualifications': qualifications,
-                    'experience': experience,
-                    'location': location,
-                    'match_percentage': match_percentage,
-                    'applied': application is not None
-                })
-
-            # Sort jobs by match percentage (highest first)
-            jobs.sort(key=lambda x: x['match_percentage'], reverse=True)
+            jobs, next_cursor = ranked_jobs_page(cursor, user_id, resume_data[2],
+                                                 decode_cursor('after', 2), page_size())
 
         # Parse skills, education, and experience from resume data
         skills = []
@@ -3690,22 +3264,22 @@ def dashboard():
             education = resume_data[4].split(',') if resume_data[4] else []
             experience = resume_data[5] if resume_data[5] else "Not specified"
 
-        conn.close()
-
-        return render_template_string(job_seeker_dashboard,
-                                     username=session['username'],
-                                     jobs=jobs,
-                                     has_resume=has_resume,
-                                     skills=skills,
-                                     education=education,
-                                     experience=experience)
+        return render_template('job_seeker_dashboard.html',
+                               username=session['username'],
+                               jobs=jobs,
+                               next_cursor=next_cursor,
+                               has_resume=has_resume,
+                               resume_job=resume_job,
+                               skills=skills,
+                               education=education,
+                               experience=experience)
 
     elif role == 'recruiter':
         # Get recruiter dashboard data
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
 
-        # Get jobs posted by this recruiter
+        # Get jobs posted by this recruiter, shared by the overview and jobs tab
         cursor.execute('''
             SELECT j.id, j.company_name, j.role_name, j.description, j.qualifications, j.experience,
                    j.location, COUNT(a.id) as applicant_count, datetime(j.id, 'unixepoch') as posted_date
@@ -3716,10 +3290,9 @@ def dashboard():
             ORDER BY j.id DESC
         ''', (user_id,))
 
-        jobs_data = cursor.fetchall()
         jobs = []
 
-        for job in jobs_data:
+        for job in cursor.fetchall():
             jobs.append({
                 'id': job[0],
                 'company_name': job[1],
@@ -3732,108 +3305,47 @@ def dashboard():
                 'posted_date': job[8]
             })
 
-        # Get recent applicants
-        cursor.execute('''
-            SELECT a.id, u.username, j.role_name, a.match_percentage,
-                   datetime(a.application_date) as app_date, a.status
-            FROM applications a
-            JOIN users u ON a.user_id = u.id
-            JOIN jobs j ON a.job_id = j.id
-            WHERE j.posted_by = ?
-            ORDER BY a.application_date DESC
-            LIMIT 10
-        ''', (user_id,))
-
-        applicants_data = cursor.fetchall()
-        applicants = []
-
-        for applicant in applicants_data:
-            applicants.append({
-                'id': applicant[0],
-                'username': applicant[1],
-                'role_name': applicant[2],
-                'match_percentage': applicant[3],
-                'application_date': applicant[4],
-                'status': applicant[5]
-            })
+        # Get a page of applicants for the applicants tab, a first page at least as long as
+        # the recent applicants list doubles as it
+        before = decode_cursor('applicants_before', 2)
+        limit = page_size()
+        all_applicants, next_cursor = applicants_page(cursor, user_id, before, limit)
+        if before or limit < RECENT_APPLICANTS:
+            applicants, _ = applicants_page(cursor, user_id, None, RECENT_APPLICANTS)
+        else:
+            applicants = all_applicants[:RECENT_APPLICANTS]
 
-        # Get all applicants for the applicants tab
+        # Calculate dashboard stats in the database
         cursor.execute('''
-            SELECT a.id, u.username, j.role_name, a.match_percentage,
-                   datetime(a.application_date) as app_date, a.status
+            SELECT COUNT(a.id),
+                   COALESCE(SUM(a.status = 'pending'), 0),
+                   COALESCE(SUM(a.match_percentage), 0)
             FROM applications a
-            JOIN users u ON a.user_id = u.id
             JOIN jobs j ON a.job_id = j.id
             WHERE j.posted_by = ?
-            ORDER BY a.application_date DESC
-        ''', (user_id,))
-
-        all_applicants_data = cursor.fetchall()
-        all_applicants = []
-
-        for applicant in all_applicants_data:
-            all_applicants.append({
-                'id': applicant[0],
-                'username': applicant[1],
-                'role_name': applicant[2],
-                'match_percentage': applicant[3],
-                'application_date': applicant[4],
-                'status': applicant[5]
-            })
-
-        # Get all jobs for the jobs tab
-        cursor.execute('''
-            SELECT j.id, j.company_name, j.role_name, j.description, j.qualifications, j.experience,
-                   j.location, COUNT(a.id) as applicant_count, datetime(j.id, 'unixepoch') as posted_date
-            FROM jobs j
-            LEFT JOIN applications a ON j.id = a.job_id
-            WHERE j.posted_by = ?
-            GROUP BY j.id
-            ORDER BY j.id DESC
         ''', (user_id,))
-
-        all_jobs_data = cursor.fetchall()
-        all_jobs = []
-
-        for job in all_jobs_data:
-            all_jobs.append({
-                'id': job[0],
-                'company_name': job[1],
-                'role_name': job[2],
-                'description': job[3],
-                'qualifications': job[4],
-                'experience': job[5],
-                'location': job[6] if job[6] else "Not specified",
-                'applicant_count': job[7],
-                'posted_date': job[8]
-            })
-
-        # Calculate dashboard stats
-        active_jobs = len(jobs)
-        total_applicants = len(all_applicants)
-        new_applicants = len([a for a in all_applicants if a['status'] == 'pending'])
+        total_applicants, new_applicants, match_total = cursor.fetchone()
 
         # Calculate average match percentage
         avg_match = 0
         if total_applicants > 0:
-            avg_match = sum(a['match_percentage'] for a in all_applicants) // total_applicants
+            avg_match = match_total // total_applicants
 
         stats = {
-            'active_jobs': active_jobs,
+            'active_jobs': len(jobs),
             'total_applicants': total_applicants,
             'new_applicants': new_applicants,
             'avg_match': avg_match
         }
 
-        conn.close()
-
-        return render_template_string(recruiter_dashboard,
-                                     username=session['username'],
-                                     jobs=jobs,
-                                     applicants=applicants,
-                                     all_jobs=all_jobs,
-                                     all_applicants=all_applicants,
-                                     stats=stats)
+        return render_template('recruiter_dashboard.html',
+                               username=session['username'],
+                               jobs=jobs,
+                               applicants=applicants,
+                               all_jobs=jobs,
+                               all_applicants=all_applicants,
+                               next_cursor=next_cursor,
+                               stats=stats)
 
     return redirect(url_for('login'))
 
@@ -3850,56 +3362,49 @@ def upload_resume():
         return redirect(url_for('dashboard'))
 
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        user_id = get_user_id(session['username'])
+        saved = save_upload(file, user_id)
+        if saved is None:
+            abort(413)
+        filepath, content_hash = saved
 
-        # Analyze resume
-        resume_analysis = analyze_resume(filepath)
+        # Hand the file to the resume workers, the dashboard polls for the result
+        job_id = enqueue_resume(user_id, filepath, content_hash)
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify({'job_id': job_id, 'status': 'queued',
+                            'status_url': url_for('resume_job_status', job_id=job_id)}), 202
 
-        # Store resume data in database
-        user_id = get_user_id(session['username'])
+    return redirect(url_for('dashboard'))
 
-        conn = sqlite3.connect('database.db')
-        cursor = conn.cursor()
+@app.errorhandler(413)
+def upload_too_large(error):
+    if request.endpoint != 'upload_resume':
+        # Other oversized requests are not resume uploads, keep Flask's default response
+        return error
+    message = f'Resume files are limited to {MAX_UPLOAD_SIZE // (1024 * 1024)} MB'
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({'error': message}), 413
+    # The upload form is a plain HTML form, show the error on the dashboard it came from
+    flash(message)
+    return redirect(url_for('dashboard'))
 
-        # Check if user already has a resume
-        cursor.execute('SELECT id FROM resumes WHERE user_id = ?', (user_id,))
-        existing_resume = cursor.fetchone()
+@app.route('/resume_jobs/<int:job_id>')
+def resume_job_status(job_id):
+    if 'username' not in session or session['role'] != 'job_seeker':
+        return jsonify({'error': 'Not authorized'}), 401
 
-        if existing_resume:
-            # Update existing resume
-            cursor.execute('''
-                UPDATE resumes
-                SET resume_text = ?, skills = ?, education = ?, experience = ?
-                WHERE user_id = ?
-            ''', (
-                resume_analysis['full_text'],
-                ','.join(resume_analysis['skills']),
-                ','.join(resume_analysis['education']),
-                resume_analysis['experience'],
-                user_id
-            ))
-        else:
-            # Insert new resume
-            cursor.execute('''
-                INSERT INTO resumes (user_id, resume_text, skills, education, experience)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                user_id,
-                resume_analysis['full_text'],
-                ','.join(resume_analysis['skills']),
-                ','.join(resume_analysis['education']),
-                resume_analysis['experience']
-            ))
+    user_id = get_user_id(session['username'])
 
-        conn.commit()
-        conn.close()
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT id, status, error FROM resume_jobs WHERE id = ? AND user_id = ?',
+                   (job_id, user_id))
+    job = cursor.fetchone()
 
-        # Delete the file after processing
-        os.remove(filepath)
+    if not job:
+        return jsonify({'error': 'Resume job not found'}), 404
 
-    return redirect(url_for('dashboard'))
+    return jsonify({'job_id': job[0], 'status': job[1], 'error': job[2]})
 
 @app.route('/post_job', methods=['GET', 'POST'])
 def post_job():
@@ -3916,51 +3421,57 @@ def post_job():
 
         user_id = get_user_id(session['username'])
 
-        conn = sqlite3.connect('database.db')
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO jobs (company_name, role_name, description, qualifications, experience, location, posted_by)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (company_name, role_name, description, qualifications, experience, location, user_id))
-        conn.commit()
-        conn.close()
+        # Skill bitmask stored with the job for vectorized overlap scoring
+        job_skill_text = f"{role_name} {description} {qualifications} {experience}"
+        skill_bits = skill_bitsets([extract_skill_ids(job_skill_text)])[0]
+        # Required years parsed once here instead of on every scoring pass
+        required_years = required_experience_years(experience, job_skill_text)
+
+        with db_write() as cursor:
+            cursor.execute('''
+                INSERT INTO jobs (company_name, role_name, description, qualifications, experience, location,
+                                  posted_by, skill_bits, skills_version, experience_years)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (company_name, role_name, description, qualifications, experience, location, user_id,
+                  skill_bits.tobytes(), skill_index.current().version, required_years))
+            job_id = cursor.lastrowid
+        job_store.job_posted(job_id)
+
+        # Score the new job against every stored resume
+        refresh_job_scores(job_id)
 
         return redirect(url_for('dashboard'))
 
-    return render_template_string(post_job_page)
+    return render_template('post_job.html')
 
 @app.route('/job_details/<int:job_id>')
 def job_details(job_id):
     if 'username' not in session:
         return jsonify({'error': 'Not logged in'}), 401
 
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
     job = cursor.fetchone()
 
     if not job:
-        conn.close()
         return jsonify({'error': 'Job not found'}), 404
 
+    user_id = get_user_id(session['username'])
+
     # Calculate match percentage if job seeker
     match_percentage = 0
     if session['role'] == 'job_seeker':
-        user_id = get_user_id(session['username'])
         cursor.execute('SELECT resume_text FROM resumes WHERE user_id = ?', (user_id,))
         resume = cursor.fetchone()
 
         if resume:
-            job_description = f"{job[2]} {job[3]} {job[4]} {job[5]}"
-            match_percentage = calculate_match_percentage(resume[0], job_description)
+            match_percentage = get_match_scores(cursor, user_id, resume[0], [job_id])[job_id]
 
     # Check if user has already applied
-    user_id = get_user_id(session['username'])
     cursor.execute('SELECT id FROM applications WHERE job_id = ? AND user_id = ?', (job_id, user_id))
     application = cursor.fetchone()
 
-    conn.close()
-
     return jsonify({
         'id': job[0],
         'company_name': job[1],
@@ -3973,6 +3484,41 @@ def job_details(job_id):
         'applied': application is not None
     })
 
+@app.route('/jobs/<int:job_id>/top_candidates')
+def top_candidates(job_id):
+    if 'username' not in session or session['role'] != 'recruiter':
+        return jsonify({'error': 'Not authorized'}), 401
+
+    k = min(max(request.args.get('k', 10, type=int), 1), MAX_TOP_CANDIDATES)
+    user_id = get_user_id(session['username'])
+
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT id FROM jobs WHERE id = ? AND posted_by = ?', (job_id, user_id))
+    job = cursor.fetchone()
+
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    ranked = top_candidate_scores(cursor, job_id, k)
+
+    # Look up the usernames of the ranked resumes in one query
+    usernames = {}
+    if ranked:
+        candidate_ids = [candidate_id for _, candidate_id in ranked]
+        cursor.execute('SELECT id, username FROM users WHERE id IN (%s)' % ','.join('?' * len(candidate_ids)),
+                       candidate_ids)
+        usernames = dict(cursor.fetchall())
+
+    return jsonify({
+        'job_id': job_id,
+        'candidates': [{
+            'user_id': candidate_id,
+            'username': usernames.get(candidate_id),
+            'match_percentage': score
+        } for score, candidate_id in ranked]
+    })
+
 @app.route('/apply_job/<int:job_id>', methods=['POST'])
 def apply_job(job_id):
     if 'username' not in session or session['role'] != 'job_seeker':
@@ -3980,23 +3526,14 @@ def apply_job(job_id):
 
     user_id = get_user_id(session['username'])
 
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
 
-    # Check if user has already applied
-    cursor.execute('SELECT id FROM applications WHERE job_id = ? AND user_id = ?', (job_id, user_id))
-    existing_application = cursor.fetchone()
-
-    if existing_application:
-        conn.close()
-        return jsonify({'success': False, 'message': 'You have already applied for this job'})
-
     # Check if user has a resume
     cursor.execute('SELECT resume_text FROM resumes WHERE user_id = ?', (user_id,))
     resume = cursor.fetchone()
 
     if not resume:
-        conn.close()
         return jsonify({'success': False, 'message': 'Please upload your resume before applying'})
 
     # Get job details
@@ -4004,21 +3541,20 @@ def apply_job(job_id):
     job = cursor.fetchone()
 
     if not job:
-        conn.close()
         return jsonify({'success': False, 'message': 'Job not found'})
 
     # Calculate match percentage
-    job_description = f"{job[2]} {job[3]} {job[4]} {job[5]}"
-    match_percentage = calculate_match_percentage(resume[0], job_description)
-
-    # Create application
-    cursor.execute('''
-        INSERT INTO applications (job_id, user_id, match_percentage, status)
-        VALUES (?, ?, ?, ?)
-    ''', (job_id, user_id, match_percentage, 'pending'))
+    match_percentage = get_match_scores(cursor, user_id, resume[0], [job_id])[job_id]
 
-    conn.commit()
-    conn.close()
+    # Create application, the unique (job_id, user_id) index rejects repeat applications
+    try:
+        with db_write() as cursor:
+            cursor.execute('''
+                INSERT INTO applications (job_id, user_id, match_percentage, status)
+                VALUES (?, ?, ?, ?)
+            ''', (job_id, user_id, match_percentage, 'pending'))
+    except sqlite3.IntegrityError:
+        return jsonify({'success': False, 'message': 'You have already applied for this job'})
 
     return jsonify({'success': True})
 
@@ -4027,7 +3563,7 @@ def applicant_details(application_id):
     if 'username' not in session or session['role'] != 'recruiter':
         return jsonify({'error': 'Not authorized'}), 401
 
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
 
     # Get application details
@@ -4043,7 +3579,6 @@ def applicant_details(application_id):
     application = cursor.fetchone()
 
     if not application:
-        conn.close()
         return jsonify({'error': 'Application not found'}), 404
 
     # Get resume details
@@ -4051,7 +3586,6 @@ def applicant_details(application_id):
     resume = cursor.fetchone()
 
     if not resume:
-        conn.close()
         return jsonify({'error': 'Resume not found'}), 404
 
     # Parse skills and education
@@ -4059,8 +3593,6 @@ def applicant_details(application_id):
     education = resume[4].split(',') if resume[4] else []
     experience = resume[5] if resume[5] else "Not specified"
 
-    conn.close()
-
     return jsonify({
         'id': application[0],
         'job_id': application[1],
@@ -4087,25 +3619,72 @@ def update_application_status(application_id):
     if status not in ['approved', 'rejected']:
         return jsonify({'success': False, 'message': 'Invalid status'}), 400
 
-    conn = sqlite3.connect('database.db')
-    cursor = conn.cursor()
-
     # Update application status
-    cursor.execute('UPDATE applications SET status = ? WHERE id = ?', (status, application_id))
-    conn.commit()
-    conn.close()
+    with db_write() as cursor:
+        cursor.execute('UPDATE applications SET status = ? WHERE id = ?', (status, application_id))
 
     return jsonify({'success': True})
 
 @app.route('/view_jobs')
 def view_jobs():
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM jobs')
-    jobs = cursor.fetchall()
-    conn.close()
-    
-    return render_template_string(view_jobs_page, jobs=jobs)
+    jobs, next_cursor = jobs_page(cursor, decode_cursor('after', 1), page_size())
+
+    return render_template('view_jobs.html', jobs=jobs, next_cursor=next_cursor)
+
+@app.route('/jobs')
+def list_jobs():
+    conn = get_db()
+    cursor = conn.cursor()
+    jobs, next_cursor = jobs_page(cursor, decode_cursor('after', 1), page_size())
+
+    return jsonify({
+        'jobs': [{
+            'id': job[0],
+            'company_name': job[1],
+            'role_name': job[2],
+            'description': job[3],
+            'qualifications': job[4],
+            'experience': job[5],
+            'location': job[6]
+        } for job in jobs],
+        'next': next_cursor
+    })
+
+@app.route('/jobs/matches')
+def list_job_matches():
+    if 'username' not in session or session['role'] != 'job_seeker':
+        return jsonify({'error': 'Not authorized'}), 401
+
+    user_id = get_user_id(session['username'])
+
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT resume_text FROM resumes WHERE user_id = ?', (user_id,))
+    resume = cursor.fetchone()
+
+    if not resume:
+        return jsonify({'error': 'Please upload your resume first'}), 404
+
+    jobs, next_cursor = ranked_jobs_page(cursor, user_id, resume[0],
+                                         decode_cursor('after', 2), page_size())
+    return jsonify({'jobs': jobs, 'next': next_cursor})
+
+@app.route('/applicants')
+def list_applicants():
+    if 'username' not in session or session['role'] != 'recruiter':
+        return jsonify({'error': 'Not authorized'}), 401
+
+    user_id = get_user_id(session['username'])
+
+    conn = get_db()
+    cursor = conn.cursor()
+    applicants, next_cursor = applicants_page(cursor, user_id, decode_cursor('before', 2), page_size())
+    return jsonify({'applicants': applicants, 'next': next_cursor})
 
 if __name__ == '__main__':
+    # With the debug reloader only the serving child process starts the workers
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_resume_workers()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,4 @@
+document.getElementById('resume').addEventListener('change', function(e) {
+    var fileName = e.target.files[0] ? e.target.files[0].name : 'No file chosen';
+    document.getElementById('selected-file').textContent = fileName;
+});
@@ -0,0 +1,152 @@
+// Toggle between jobs and resume sections
+document.getElementById('resume-menu-item').addEventListener('click', function() {
+    document.getElementById('jobs-section').style.display = 'none';
+    document.getElementById('resume-section').style.display = 'block';
+
+    // Update active menu item
+    document.querySelector('.sidebar-menu li.active').classList.remove('active');
+    this.classList.add('active');
+});
+
+// Show file name when selected
+document.getElementById('resume-file').addEventListener('change', function() {
+    const fileName = this.files[0] ? this.files[0].name : 'No file chosen';
+    document.getElementById('file-name').textContent = fileName;
+});
+
+// Job detail modal functionality
+const modal = document.getElementById('job-detail-modal');
+const closeBtn = document.querySelector('.close-btn');
+
+// Close modal when clicking the X
+closeBtn.addEventListener('click', function() {
+    modal.style.display = 'none';
+});
+
+// Close modal when clicking outside
+window.addEventListener('click', function(event) {
+    if (event.target === modal) {
+        modal.style.display = 'none';
+    }
+});
+
+// Open modal when clicking on job card
+document.querySelectorAll('.job-card').forEach(card => {
+    card.addEventListener('click', function(e) {
+        // Don't open modal if clicking apply button
+        if (e.target.classList.contains('apply-btn')) return;
+
+        const jobId = this.getAttribute('data-job-id');
+        fetchJobDetails(jobId);
+    });
+});
+
+// Apply button functionality
+document.querySelectorAll('.apply-btn').forEach(btn => {
+    btn.addEventListener('click', function(e) {
+        e.stopPropagation(); // Prevent opening the modal
+        const jobId = this.getAttribute('data-job-id');
+        applyForJob(jobId);
+    });
+});
+
+// Modal apply button
+document.getElementById('modal-apply-btn').addEventListener('click', function() {
+    const jobId = this.getAttribute('data-job-id');
+    applyForJob(jobId);
+});
+
+// Fetch job details for modal
+function fetchJobDetails(jobId) {
+    fetch(`/job_details/${jobId}`)
+        .then(response => response.json())
+        .then(data => {
+            document.getElementById('modal-job-title').textContent = data.role_name;
+            document.getElementById('modal-job-company').textContent = data.company_name;
+            document.getElementById('modal-job-description').textContent = data.description;
+            document.getElementById('modal-job-qualifications').textContent = data.qualifications;
+            document.getElementById('modal-job-experience').textContent = data.experience;
+
+            // Match details
+            const matchHtml = `
+                <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                    <div class="match-percentage ${data.match_percentage >= 70 ? 'high-match' : (data.match_percentage >= 40 ? 'medium-match' : 'low-match')}" style="margin-right: 15px;">
+                        ${data.match_percentage}%
+                    </div>
+                    <div>
+                        <div style="font-weight: bold; margin-bottom: 5px;">
+                            ${data.match_percentage >= 70 ? 'Good Match' : (data.match_percentage >= 40 ? 'Fair Match' : 'Low Match')}
+                        </div>
+                        <div>Based on your resume and the job requirements</div>
+                    </div>
+                </div>
+                <div>
+                    <p>Your resume matches ${data.match_percentage}% of the job requirements. ${
+                        data.match_percentage >= 70 ? 
+                        'You have a strong profile for this position!' : 
+                        (data.match_percentage >= 40 ? 
+                        'You meet some of the key requirements for this role.' : 
+                        'You might need additional skills or experience for this role.')
+                    }</p>
+                </div>
+            `;
+            document.getElementById('modal-match-details').innerHTML = matchHtml;
+
+            // Set job ID for apply button
+            document.getElementById('modal-apply-btn').setAttribute('data-job-id', jobId);
+
+            // Show modal
+            modal.style.display = 'block';
+        })
+        .catch(error => console.error('Error fetching job details:', error));
+}
+
+// Apply for job
+function applyForJob(jobId) {
+    fetch(`/apply_job/${jobId}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            alert('Application submitted successfully!');
+            // Update button to show applied
+            const applyBtns = document.querySelectorAll(`.apply-btn[data-job-id="${jobId}"]`);
+            applyBtns.forEach(btn => {
+                btn.textContent = 'Applied';
+                btn.disabled = true;
+                btn.style.backgroundColor = '#4CAF50';
+            });
+
+            // Close modal if open
+            modal.style.display = 'none';
+        } else {
+            alert(data.message || 'Failed to submit application. Please try again.');
+        }
+    })
+    .catch(error => {
+        console.error('Error applying for job:', error);
+        alert('An error occurred. Please try again.');
+    });
+}
+
+// Poll a queued resume until the workers finish it, then reload to show the matches
+const resumeJob = document.querySelector('.resume-job-status');
+if (resumeJob && resumeJob.getAttribute('data-status') !== 'failed') {
+    const pollResumeJob = () => {
+        fetch(`/resume_jobs/${resumeJob.getAttribute('data-job-id')}`)
+            .then(response => response.json())
+            .then(data => {
+                if (data.status === 'done' || data.status === 'failed') {
+                    window.location.reload();
+                } else {
+                    setTimeout(pollResumeJob, 2000);
+                }
+            })
+            .catch(error => console.error('Error checking resume status:', error));
+    };
+    setTimeout(pollResumeJob, 2000);
+}
@@ -0,0 +1,178 @@
+// Tab switching functionality
+document.querySelectorAll('.sidebar-menu li[data-tab]').forEach(item => {
+    item.addEventListener('click', function() {
+        // Update active tab in sidebar
+        document.querySelector('.sidebar-menu li.active').classList.remove('active');
+        this.classList.add('active');
+
+        // Show corresponding tab content
+        const tabId = this.getAttribute('data-tab');
+        document.querySelectorAll('.tab-content').forEach(tab => {
+            tab.classList.remove('active');
+        });
+        document.getElementById(tabId + '-tab').classList.add('active');
+    });
+});
+
+// Reopen the tab named in the URL hash, e.g. after following a page link
+if (location.hash) {
+    const tabLink = document.querySelector(`.sidebar-menu li[data-tab="${location.hash.slice(1)}"]`);
+    if (tabLink) tabLink.click();
+}
+
+// Modal functionality
+const postJobModal = document.getElementById('post-job-modal');
+const applicantDetailModal = document.getElementById('applicant-detail-modal');
+const closeBtns = document.querySelectorAll('.close-btn');
+
+// Open post job modal
+document.getElementById('post-job-btn').addEventListener('click', function() {
+    postJobModal.style.display = 'block';
+});
+
+document.getElementById('post-job-btn-2').addEventListener('click', function() {
+    postJobModal.style.display = 'block';
+});
+
+// Close modals when clicking the X
+closeBtns.forEach(btn => {
+    btn.addEventListener('click', function() {
+        postJobModal.style.display = 'none';
+        applicantDetailModal.style.display = 'none';
+    });
+});
+
+// Close modals when clicking outside
+window.addEventListener('click', function(event) {
+    if (event.target === postJobModal) {
+        postJobModal.style.display = 'none';
+    }
+    if (event.target === applicantDetailModal) {
+        applicantDetailModal.style.display = 'none';
+    }
+});
+
+// View applicant details
+document.querySelectorAll('.applicant-card, .view-applicant-btn').forEach(item => {
+    item.addEventListener('click', function(e) {
+        // Don't trigger if clicking on a button inside the card
+        if (e.target.classList.contains('action-btn') && !e.target.classList.contains('view-applicant-btn')) return;
+
+        const applicantId = this.closest('.applicant-card').getAttribute('data-applicant-id');
+        fetchApplicantDetails(applicantId);
+    });
+});
+
+// Fetch applicant details
+function fetchApplicantDetails(applicantId) {
+    fetch(`/applicant_details/${applicantId}`)
+        .then(response => response.json())
+        .then(data => {
+            // Set applicant details in modal
+            document.getElementById('applicant-detail-avatar').textContent = data.username[0];
+            document.getElementById('applicant-detail-name').textContent = data.username;
+            document.getElementById('applicant-detail-job').textContent = `Applied for ${data.role_name} at ${data.company_name}`;
+
+            // Match details
+            const matchClass = data.match_percentage >= 70 ? 'high-match' : (data.match_percentage >= 40 ? 'medium-match' : 'low-match');
+            const matchHtml = `
+                <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                    <div class="match-badge ${matchClass}" style="margin-right: 15px;">
+                        ${data.match_percentage}%
+                    </div>
+                    <div>
+                        <div style="font-weight: bold; margin-bottom: 5px;">
+                            ${data.match_percentage >= 70 ? 'Good Match' : (data.match_percentage >= 40 ? 'Fair Match' : 'Low Match')}
+                        </div>
+                        <div>Based on job requirements and candidate's resume</div>
+                    </div>
+                </div>
+            `;
+            document.getElementById('applicant-match-details').innerHTML = matchHtml;
+
+            // Skills
+            const skillsHtml = data.skills.map(skill => `<div class="skill-tag">${skill}</div>`).join('');
+            document.getElementById('applicant-skills').innerHTML = skillsHtml || 'No skills extracted';
+
+            // Education
+            document.getElementById('applicant-education').textContent = data.education.join(', ') || 'Not specified';
+
+            // Experience
+            document.getElementById('applicant-experience').textContent = data.experience;
+
+            // Resume text
+            document.getElementById('applicant-resume-text').textContent = data.resume_text;
+
+            // Set application ID for approve/reject buttons
+            document.getElementById('approve-btn').setAttribute('data-application-id', data.id);
+            document.getElementById('reject-btn').setAttribute('data-application-id', data.id);
+
+            // Update button states based on current status
+            if (data.status === 'approved') {
+                document.getElementById('approve-btn').disabled = true;
+                document.getElementById('approve-btn').textContent = 'Already Approved';
+                // Continue the recruiter_dashboard JavaScript
+                document.getElementById('reject-btn').disabled = false;
+            } else if (data.status === 'rejected') {
+                document.getElementById('reject-btn').disabled = true;
+                document.getElementById('reject-btn').textContent = 'Already Rejected';
+                document.getElementById('approve-btn').disabled = false;
+            } else {
+                document.getElementById('approve-btn').disabled = false;
+                document.getElementById('reject-btn').disabled = false;
+                document.getElementById('approve-btn').textContent = 'Approve Application';
+                document.getElementById('reject-btn').textContent = 'Reject Application';
+            }
+
+            // Show modal
+            applicantDetailModal.style.display = 'block';
+        })
+        .catch(error => console.error('Error fetching applicant details:', error));
+}
+
+// Approve application
+document.getElementById('approve-btn').addEventListener('click', function() {
+    const applicationId = this.getAttribute('data-application-id');
+    updateApplicationStatus(applicationId, 'approved');
+});
+
+// Reject application
+document.getElementById('reject-btn').addEventListener('click', function() {
+    const applicationId = this.getAttribute('data-application-id');
+    updateApplicationStatus(applicationId, 'rejected');
+});
+
+// Update application status
+function updateApplicationStatus(applicationId, status) {
+    fetch(`/update_application_status/${applicationId}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ status: status })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            // Close modal
+            applicantDetailModal.style.display = 'none';
+
+            // Update UI to reflect the new status
+            const statusClass = status === 'approved' ? 'status-approved' : 'status-rejected';
+            const statusText = status.charAt(0).toUpperCase() + status.slice(1);
+
+            document.querySelectorAll(`.applicant-card[data-applicant-id="${applicationId}"] .status-badge`).forEach(badge => {
+                badge.className = `status-badge ${statusClass}`;
+                badge.textContent = statusText;
+            });
+
+            alert(`Application ${statusText} successfully!`);
+        } else {
+            alert('Failed to update application status. Please try again.');
+        }
+    })
+    .catch(error => {
+        console.error('Error updating application status:', error);
+        alert('An error occurred. Please try again.');
+    });
+}